@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test Category 2: Shared Result Loading
+Parses throughput and latency from each local/remote result file in a single pass,
+so the latency and NUMA penalty charts share one scan of RESULTS_DIR
+"""
+
+import functools
+import mmap
+import os
+import re
+
+RESULTS_DIR = "numa_results_advanced/Test2"
+
+# Result file names, anchored so .perf/.vmstat_* sidecars are rejected outright
+RESULT_FILE_RE = re.compile(r'(local|remote)_node(0|0to1|1to0)_(\d+)MB_(sequential|random|stride)\.txt$')
+
+# Result bodies are scanned as raw bytes (via mmap) to skip UTF-8 decoding
+THROUGHPUT_RE = re.compile(rb'Throughput:\s+([\d.]+)\s+MB/s')
+LATENCY_RE = re.compile(rb'Average latency:\s+([\d.]+)\s+ns')
+
+def parse_test2_file(filepath):
+    """Extract (throughput, latency) from result file; either may be None"""
+    try:
+        with open(filepath, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            throughput_match = THROUGHPUT_RE.search(mm)
+            latency_match = LATENCY_RE.search(mm)
+            # group() slices the mmap lazily, so convert before it is closed
+            throughput = float(throughput_match.group(1)) if throughput_match else None
+            latency = float(latency_match.group(1)) if latency_match else None
+        return throughput, latency
+    except:
+        return None, None
+
+@functools.lru_cache(maxsize=1)
+def load_test2():
+    """Collect (throughput, latency) for every local/remote result file
+
+    Returns {size: {pattern: {link: (throughput, latency)}}} where link is
+    'local', 'remote_0to1' or 'remote_1to0'. Cached, so treat it as read-only.
+    """
+    data = {}
+
+    with os.scandir(RESULTS_DIR) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    for entry in entries:
+        # Parse: local_node0_512MB_sequential.txt, remote_node0to1_512MB_sequential.txt
+        match = RESULT_FILE_RE.match(entry.name)
+        if not match:
+            continue
+
+        access_type = match.group(1)  # local or remote
+        node_info = match.group(2)     # 0, 0to1, or 1to0
+        if access_type == 'local':
+            link = 'local'
+        elif node_info in ('0to1', '1to0'):
+            link = f'remote_{node_info}'
+        else:
+            continue
+
+        size_mb = int(match.group(3))
+        pattern = match.group(4)
+
+        throughput, latency = parse_test2_file(entry.path)
+        if throughput is not None or latency is not None:
+            data.setdefault(size_mb, {}).setdefault(pattern, {})[link] = (throughput, latency)
+
+    return data
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test Category 4: Shared Result Loading
+Classifies the Test4 result files and parses the baseline/static/migrated runs,
+so the migration and migration cost scripts share one implementation
+"""
+
+import functools
+import mmap
+import os
+import re
+
+RESULTS_DIR = "numa_results_advanced/Test4"
+
+# Result file names, anchored so .perf/.vmstat_* sidecars are rejected outright
+RESULT_PREFIXES = ('baseline_local_', 'static_remote_', 'auto_migrated_', 'auto_numa_')
+RESULT_FILE_RE = re.compile(r'(baseline_local|static_remote|auto_migrated|auto_numa)_(\d+)MB(_timeline)?\.txt$')
+
+# Cost comparison categories (as reported by scan_results) -> key in collect_cost_data
+COST_KEYS = {
+    'baseline_local': 'baseline',
+    'static_remote': 'static_remote',
+    'auto_migrated': 'auto_migrated',
+}
+
+# Result bodies are scanned as raw bytes (via mmap) to skip UTF-8 decoding
+THROUGHPUT_RE = re.compile(rb'Throughput:\s+([\d.]+)\s+MB/s')
+LATENCY_RE = re.compile(rb'Average latency:\s+([\d.]+)\s+ns')
+ELAPSED_AFTER_RE = re.compile(rb'time elapsed\s*\n\s+([\d.]+)\s+seconds')
+MIGRATION_TIME_RE = re.compile(rb'Time:\s+([\d.]+)\s+seconds')
+TIME_ELAPSED_RE = re.compile(rb'([\d.]+)\s+seconds time elapsed')
+
+@functools.lru_cache(maxsize=1)
+def scan_results():
+    """Classify RESULTS_DIR in one scandir pass into (category, size_mb, path) tuples
+
+    category is the file prefix (e.g. 'baseline_local'), with '_timeline'
+    appended for *_timeline.txt files. Cached, so every chart shares one walk.
+    """
+    results = []
+    with os.scandir(RESULTS_DIR) as it:
+        for entry in it:
+            # Cheap string checks reject sidecars and unrelated tests before the regex runs
+            if not entry.name.endswith('.txt') or not entry.name.startswith(RESULT_PREFIXES):
+                continue
+            match = RESULT_FILE_RE.match(entry.name)
+            if match:
+                category = match.group(1) + (match.group(3) or '')
+                results.append((category, int(match.group(2)), entry.path))
+    return tuple(results)
+
+def cached_by_mtime(parser):
+    """Cache parser(path) per (path, mtime), so a file shared by several charts is parsed once
+
+    Only the parsed result is kept, never the file body, and a rewritten file
+    is parsed again. Results are shared between callers, so treat them as read-only.
+    """
+    @functools.lru_cache(maxsize=256)
+    def load(path, mtime_ns):
+        return parser(path)
+
+    @functools.wraps(parser)
+    def cached_parser(path):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return load(path, mtime_ns)
+
+    return cached_parser
+
+@cached_by_mtime
+def parse_throughput(filepath):
+    """Extract throughput from result file"""
+    try:
+        with open(filepath, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            throughput_match = THROUGHPUT_RE.search(mm)
+            # group() slices the mmap lazily, so convert before it is closed
+            return float(throughput_match.group(1)) if throughput_match else None
+    except (OSError, ValueError):  # ValueError: an empty file cannot be mapped
+        return None
+
+@cached_by_mtime
+def parse_sequential_test(filepath):
+    """Parse sequential test results for cost comparison"""
+    result = {}
+    try:
+        with open(filepath, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Extract throughput and time
+            throughput_match = THROUGHPUT_RE.search(mm)
+            latency_match = LATENCY_RE.search(mm)
+            time_match = ELAPSED_AFTER_RE.search(mm)
+
+            # group() slices the mmap lazily, so convert before it is closed
+            if throughput_match:
+                result['throughput'] = float(throughput_match.group(1))
+            if latency_match:
+                result['latency'] = float(latency_match.group(1))
+            if time_match:
+                result['time'] = float(time_match.group(1))
+    except (OSError, ValueError):  # ValueError: an empty file cannot be mapped
+        return None
+
+    return result if result else None
+
+@cached_by_mtime
+def parse_migration_test(filepath):
+    """Parse migration test results"""
+    result = {}
+    try:
+        with open(filepath, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Extract time from migration test
+            time_match = MIGRATION_TIME_RE.search(mm)
+            elapsed_match = TIME_ELAPSED_RE.search(mm)
+
+            # group() slices the mmap lazily, so convert before it is closed
+            if time_match:
+                result['time'] = float(time_match.group(1))
+            elif elapsed_match:
+                result['time'] = float(elapsed_match.group(1))
+    except (OSError, ValueError):  # ValueError: an empty file cannot be mapped
+        return None
+
+    return result if result else None
+
+def collect_cost_data():
+    """Collect throughput for migration cost comparison
+
+    Returns {size: {'baseline': X, 'static_remote': Y, 'auto_migrated': Z}};
+    a key is missing when its file has no throughput line.
+    """
+    data = {}
+
+    for category, size_mb, filepath in scan_results():
+        if category not in COST_KEYS:
+            continue
+
+        throughput = parse_throughput(filepath)
+        if throughput is not None:
+            data.setdefault(size_mb, {})[COST_KEYS[category]] = throughput
+
+    return data
+
+def format_size_label(size_mb):
+    """Convert MB to GB if >= 1024 MB for clearer labels"""
+    if size_mb >= 1024:
+        return f'{size_mb // 1024} GB'
+    else:
+        return f'{size_mb} MB'
@@ -14,17 +14,54 @@ Outputs:
 - category1_preferred_fallback_counters.png (Performance counter evidence)
 """
 
+import functools
+import glob
+import mmap
 import os
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever saved to PNG
 import matplotlib.pyplot as plt
 import numpy as np
+from plot_freshness import is_up_to_date
 
 RESULTS_DIR = "numa_results_advanced/Test1"
 MIN_SIZE_MB = 512  # Filter out small sizes where cache effects dominate
+NODE0_MEMINFO = "/sys/devices/system/node/node0/meminfo"
+NODE_MEMTOTAL_RE = re.compile(r'MemTotal:\s+(\d+)\s+kB')
 
+# Result file names, run only on glob matches to validate them and pull out the fields
+PRESSURE_FILE_RE = re.compile(r'(membind|preferred)_node0_(\d+)MB_(sequential|random|stride)\.txt$')
+PREFERRED_RANDOM_FILE_RE = re.compile(r'preferred_node0_(\d+)MB_random\.txt$')
+
+# Result bodies are scanned as raw bytes (via mmap) to skip UTF-8 decoding
+THROUGHPUT_RE = re.compile(rb'Throughput:\s+([\d.]+)\s+MB/s')
+LATENCY_RE = re.compile(rb'Average latency:\s+([\d.]+)\s+ns')
+VMSTAT_LINE_RE = re.compile(rb'^(\S+)[ \t]+(\d+)[ \t]*$', re.MULTILINE)
+
+def search_float(pattern, buf):
+    """Return the first captured group of pattern in buf as a float, or None"""
+    # group() slices buf lazily, so convert while an mmap buffer is still open
+    match = pattern.search(buf)
+    return float(match.group(1)) if match else None
+
+@functools.lru_cache(maxsize=1)
 def get_node_capacity():
-    """Detect NUMA node memory capacity using numactl"""
+    """Detect NUMA node 0 memory capacity in MB (cached)
+
+    Reads sysfs directly; numactl is only spawned if that file is unavailable.
+    """
+    try:
+        with open(NODE0_MEMINFO, 'r') as f:
+            # Parse: "Node 0 MemTotal:       98765432 kB" (numactl reports this in MB)
+            match = NODE_MEMTOTAL_RE.search(f.read())
+        if match:
+            return int(match.group(1)) // 1024
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             ["numactl", "--hardware"],
@@ -50,20 +87,15 @@ def format_size_label(size_mb):
 def parse_test_result(filepath):
     """Extract throughput and latency from test result file"""
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
+        with open(filepath, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Check if process was killed; bail out before running either numeric regex
+            if mm.find(b'Killed') != -1 or mm.find(b'killed') != -1:
+                return None, None, True
 
-        # Check if process was killed
-        if 'Killed' in content or 'killed' in content:
-            return None, None, True
-
-        # Parse throughput
-        throughput_match = re.search(r'Throughput:\s+([\d.]+)\s+MB/s', content)
-        throughput = float(throughput_match.group(1)) if throughput_match else None
-
-        # Parse latency
-        latency_match = re.search(r'Average latency:\s+([\d.]+)\s+ns', content)
-        latency = float(latency_match.group(1)) if latency_match else None
+            # Parse throughput and latency
+            throughput = search_float(THROUGHPUT_RE, mm)
+            latency = search_float(LATENCY_RE, mm)
 
         return throughput, latency, False
     except FileNotFoundError:
@@ -71,38 +103,41 @@ def parse_test_result(filepath):
     except Exception as e:
         return None, None, False
 
+def read_vmstat(path):
+    """Read a /proc/vmstat snapshot as {counter: value}, both as raw bytes"""
+    with open(path, 'rb') as f:
+        return dict(VMSTAT_LINE_RE.findall(f.read()))
+
 def parse_vmstat_delta(filepath):
-    """Calculate NUMA counter deltas from vmstat_before and vmstat_after files"""
+    """Calculate NUMA counter deltas from vmstat_before and vmstat_after files
+
+    Keys are left as bytes (e.g. b'numa_miss') to skip decoding every counter name.
+    """
     try:
-        vmstat_before = {}
-        vmstat_after = {}
-
-        # Read before
-        with open(filepath + '.vmstat_before', 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    vmstat_before[parts[0]] = int(parts[1])
-
-        # Read after
-        with open(filepath + '.vmstat_after', 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    vmstat_after[parts[0]] = int(parts[1])
+        vmstat_before = read_vmstat(filepath + '.vmstat_before')
+        vmstat_after = read_vmstat(filepath + '.vmstat_after')
 
         # Calculate deltas
-        deltas = {}
-        for key in vmstat_after:
-            if key in vmstat_before:
-                deltas[key] = vmstat_after[key] - vmstat_before[key]
-
-        return deltas
+        return {key: int(vmstat_after[key]) - int(vmstat_before[key])
+                for key in vmstat_after.keys() & vmstat_before.keys()}
     except:
         return {}
 
+def parse_counter_result(filepath):
+    """Return vmstat deltas for a completed test, or None if it was killed or has no throughput"""
+    throughput, _, was_killed = parse_test_result(filepath)
+    if was_killed or throughput is None:
+        return None
+    return parse_vmstat_delta(filepath)
+
+@functools.lru_cache(maxsize=1)
 def collect_pressure_curve_data():
-    """Collect data for pressure curve visualization"""
+    """Collect data for pressure curve visualization
+
+    Cached so the throughput and latency plots share a single scan of RESULTS_DIR.
+    Callers must treat the returned structure as read-only.
+    """
+    # {policy: {pattern: {size_mb: (throughput, latency)}}}
     data = {
         'membind': {},
         'preferred': {}
@@ -110,28 +145,31 @@ def collect_pressure_curve_data():
 
     for policy in ['membind', 'preferred']:
         for pattern in ['sequential', 'random', 'stride']:
-            data[policy][pattern] = {
-                'sizes': [],
-                'throughput': [],
-                'latency': []
-            }
+            data[policy][pattern] = {}
 
-    # Scan all result files
-    for filename in sorted(os.listdir(RESULTS_DIR)):
-        match = re.match(r'(membind|preferred)_node0_(\d+)MB_(sequential|random|stride)\.txt', filename)
+    # Scan result files; the globs drop sidecars and unrelated tests before any regex runs
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, 'membind_node0_*MB_*.txt')) +
+                   glob.glob(os.path.join(RESULTS_DIR, 'preferred_node0_*MB_*.txt')))
+
+    jobs = []  # (policy, pattern, size_mb, filepath)
+    for filepath in paths:
+        match = PRESSURE_FILE_RE.match(os.path.basename(filepath))
         if match:
             policy = match.group(1)
             size_mb = int(match.group(2))
             pattern = match.group(3)
 
-            filepath = os.path.join(RESULTS_DIR, filename)
-            throughput, latency, was_killed = parse_test_result(filepath)
-
             # Only include sizes >= MIN_SIZE_MB to avoid cache-dominated behavior
-            if not was_killed and throughput is not None and size_mb >= MIN_SIZE_MB:
-                data[policy][pattern]['sizes'].append(size_mb)
-                data[policy][pattern]['throughput'].append(throughput)
-                data[policy][pattern]['latency'].append(latency if latency else 0)
+            if size_mb >= MIN_SIZE_MB:
+                jobs.append((policy, pattern, size_mb, filepath))
+
+    # File reads and byte-regex scans release the GIL, so parse on a thread pool
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(parse_test_result, [job[3] for job in jobs])
+
+        for (policy, pattern, size_mb, _), (throughput, latency, was_killed) in zip(jobs, results):
+            if not was_killed and throughput is not None:
+                data[policy][pattern][size_mb] = (throughput, latency if latency else 0)
 
     return data
 
@@ -141,306 +179,276 @@ def collect_preferred_counter_data():
     raw_data = {}
 
     # Parse preferred_node0_*MB_random.txt files
-    for filename in os.listdir(RESULTS_DIR):
-        match = re.match(r'preferred_node0_(\d+)MB_random\.txt', filename)
-        if match:
-            size_mb = int(match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
+    jobs = []  # (size_mb, filepath)
+    for filepath in glob.glob(os.path.join(RESULTS_DIR, 'preferred_node0_*MB_random.txt')):
+        match = PREFERRED_RANDOM_FILE_RE.match(os.path.basename(filepath))
+        if not match:
+            continue
 
-            throughput, _, was_killed = parse_test_result(filepath)
-            # Only include sizes >= MIN_SIZE_MB to avoid cache-dominated behavior
-            if was_killed or throughput is None or size_mb < MIN_SIZE_MB:
-                continue
+        size_mb = int(match.group(1))
 
-            vmstat_deltas = parse_vmstat_delta(filepath)
+        # Only include sizes >= MIN_SIZE_MB to avoid cache-dominated behavior
+        if size_mb >= MIN_SIZE_MB:
+            jobs.append((size_mb, filepath))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(parse_counter_result, [job[1] for job in jobs])
+
+        for (size_mb, _), vmstat_deltas in zip(jobs, results):
+            if vmstat_deltas is None:
+                continue
 
             raw_data[size_mb] = {
-                'numa_miss': vmstat_deltas.get('numa_miss', 0),
-                'numa_foreign': vmstat_deltas.get('numa_foreign', 0),
-                'numa_pages_migrated': vmstat_deltas.get('numa_pages_migrated', 0)
+                'numa_miss': vmstat_deltas.get(b'numa_miss', 0),
+                'numa_foreign': vmstat_deltas.get(b'numa_foreign', 0),
+                'numa_pages_migrated': vmstat_deltas.get(b'numa_pages_migrated', 0)
             }
 
-    # Sort by size and build final data structure
-    data = {
-        'sizes': [],
-        'numa_miss': [],
-        'numa_foreign': [],
-        'numa_pages_migrated': []
-    }
-
-    for size_mb in sorted(raw_data.keys()):
-        data['sizes'].append(size_mb)
-        data['numa_miss'].append(raw_data[size_mb]['numa_miss'])
-        data['numa_foreign'].append(raw_data[size_mb]['numa_foreign'])
-        data['numa_pages_migrated'].append(raw_data[size_mb]['numa_pages_migrated'])
+    # Sort by size and build final data structure, one list per key in a single pass each
+    sizes = sorted(raw_data)
+    data = {'sizes': sizes}
+    for key in ('numa_miss', 'numa_foreign', 'numa_pages_migrated'):
+        data[key] = [raw_data[size_mb][key] for size_mb in sizes]
 
     return data
 
-def plot_throughput_pressure():
-    """Generate throughput comparison across patterns and policies"""
-    data = collect_pressure_curve_data()
-    node_capacity = get_node_capacity()
+def plot_grouped_metric(ax, title, all_sizes, membind_vals, preferred_vals,
+                        xlabel, ylabel, increase, node_capacity):
+    """Draw membind vs preferred bars for one access pattern
 
-    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
-    patterns = ['sequential', 'random', 'stride']
-    pattern_titles = ['Sequential Access', 'Random Access', 'Stride Access']
+    The red arrow tracks the preferred policy from the smallest to the largest size;
+    increase selects whether it is labelled as a rise (latency) or a drop (throughput).
+    """
+    # Create discrete x positions
+    x = np.arange(len(all_sizes))
+    width = 0.35
+
+    # Plot bars
+    bars1 = ax.bar(x - width/2, membind_vals, width, label='Membind (Strict)',
+                   color='#ff7f0e', alpha=0.8, rasterized=True)
+    bars2 = ax.bar(x + width/2, preferred_vals, width, label='Preferred (Fallback)',
+                   color='#2ca02c', alpha=0.8, rasterized=True)
+
+    # Add degradation arrow for preferred policy
+    if len(preferred_vals) >= 2:
+        # Arrow from first to last
+        baseline_val = preferred_vals[0]
+        final_val = preferred_vals[-1]
+        if baseline_val > 0 and final_val > 0:
+            if increase:
+                change_label = f'↑{((final_val - baseline_val) / baseline_val) * 100:.0f}%'
+            else:
+                change_label = f'↓{((baseline_val - final_val) / baseline_val) * 100:.0f}%'
+
+            # Draw arrow
+            arrow_props = dict(arrowstyle='->', color='red', lw=2.5, alpha=0.7)
+            ax.annotate('',
+                       xy=(len(all_sizes)-1 + width/2, final_val),
+                       xytext=(0 + width/2, baseline_val),
+                       arrowprops=arrow_props)
+
+            # Add label
+            mid_x = len(all_sizes) / 2
+            mid_y = (baseline_val + final_val) / 2
+            ax.text(mid_x, mid_y, change_label,
+                   fontsize=13, color='red', fontweight='bold',
+                   bbox=dict(boxstyle='round,pad=0.4', facecolor='white',
+                            edgecolor='red', alpha=0.9, linewidth=2))
+
+    # Formatting
+    ax.set_xlabel(xlabel, fontsize=13, fontweight='bold')
+    ax.set_ylabel(ylabel, fontsize=13, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.tick_params(axis='x', labelsize=13)
+    ax.set_xticklabels([format_size_label(s) for s in all_sizes], rotation=45, ha='right')
+    ax.legend(fontsize=14)
+    ax.grid(True, alpha=0.3, axis='y')
+
+    # Add pivot point if detected
+    if node_capacity:
+        # First position whose size reaches node capacity
+        pivot_idx = int(np.searchsorted(all_sizes, node_capacity))
+        if pivot_idx < len(all_sizes):
+            ax.axvline(x=pivot_idx-0.5, color='gray', linestyle=':', linewidth=2, alpha=0.7)
+
+def plot_throughput_pressure(data, node_capacity):
+    """Generate throughput comparison across patterns and policies
+
+    data comes from collect_pressure_curve_data() and node_capacity from
+    get_node_capacity().
+    """
+    if not any(sizes for patterns in data.values() for sizes in patterns.values()):
+        print("No data found for membind/preferred pressure tests")
+        return
 
-    for idx, pattern in enumerate(patterns):
-        ax = axes[idx]
+    if is_up_to_date('category1_throughput_pressure.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category1_throughput_pressure.png")
+        return
 
-        # Get all unique sizes for this pattern (union of membind and preferred)
-        all_sizes = sorted(set(data['membind'][pattern]['sizes'] + data['preferred'][pattern]['sizes']))
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6), constrained_layout=True)
+    try:
+        patterns = ['sequential', 'random', 'stride']
+        pattern_titles = ['Sequential Access', 'Random Access', 'Stride Access']
 
-        if not all_sizes:
-            continue
+        for idx, pattern in enumerate(patterns):
+            membind = data['membind'][pattern]
+            preferred = data['preferred'][pattern]
 
-        # Prepare data for grouped bar chart
-        membind_vals = []
-        preferred_vals = []
+            # Get all unique sizes for this pattern (union of membind and preferred)
+            size_keys = membind.keys() | preferred.keys()
 
-        for size in all_sizes:
-            # Find membind value
-            if size in data['membind'][pattern]['sizes']:
-                idx_mb = data['membind'][pattern]['sizes'].index(size)
-                membind_vals.append(data['membind'][pattern]['throughput'][idx_mb])
-            else:
-                membind_vals.append(0)  # No data (killed)
+            if not size_keys:
+                continue
 
-            # Find preferred value
-            if size in data['preferred'][pattern]['sizes']:
-                idx_pf = data['preferred'][pattern]['sizes'].index(size)
-                preferred_vals.append(data['preferred'][pattern]['throughput'][idx_pf])
-            else:
-                preferred_vals.append(0)
+            all_sizes = np.fromiter(sorted(size_keys), dtype=np.int32, count=len(size_keys))
 
-        # Create discrete x positions
-        x = np.arange(len(all_sizes))
-        width = 0.35
-
-        # Plot bars
-        bars1 = ax.bar(x - width/2, membind_vals, width, label='Membind (Strict)',
-                       color='#ff7f0e', alpha=0.8)
-        bars2 = ax.bar(x + width/2, preferred_vals, width, label='Preferred (Fallback)',
-                       color='#2ca02c', alpha=0.8)
-
-        # Add degradation arrow for preferred policy
-        if len(preferred_vals) >= 2:
-            # Arrow from first to last
-            baseline_val = preferred_vals[0]
-            final_val = preferred_vals[-1]
-            if baseline_val > 0 and final_val > 0:
-                degradation_pct = ((baseline_val - final_val) / baseline_val) * 100
-
-                # Draw arrow
-                arrow_props = dict(arrowstyle='->', color='red', lw=2.5, alpha=0.7)
-                ax.annotate('',
-                           xy=(len(all_sizes)-1 + width/2, final_val),
-                           xytext=(0 + width/2, baseline_val),
-                           arrowprops=arrow_props)
-
-                # Add label
-                mid_x = len(all_sizes) / 2
-                mid_y = (baseline_val + final_val) / 2
-                ax.text(mid_x, mid_y, f'↓{degradation_pct:.0f}%',
-                       fontsize=13, color='red', fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.4', facecolor='white',
-                                edgecolor='red', alpha=0.9, linewidth=2))
-
-        # Formatting
-        ax.set_xlabel('Memory Size', fontsize=13, fontweight='bold')
-        ax.set_ylabel('Throughput (MB/s)', fontsize=13, fontweight='bold')
-        ax.set_title(pattern_titles[idx], fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.tick_params(axis='x', labelsize=13)
-        ax.set_xticklabels([format_size_label(s) for s in all_sizes], rotation=45, ha='right')
-        ax.legend(fontsize=14)
-        ax.grid(True, alpha=0.3, axis='y')
-
-        # Add pivot point if detected
-        if node_capacity:
-            # Find the position closest to node capacity
-            for i, size in enumerate(all_sizes):
-                if size >= node_capacity:
-                    ax.axvline(x=i-0.5, color='gray', linestyle=':', linewidth=2, alpha=0.7)
-                    break
-
-    plt.suptitle('Throughput - Memory Pressure & Fallback Behavior',
-                 fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('category1_throughput_pressure.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category1_throughput_pressure.png")
-    plt.close()
-
-def plot_latency_pressure():
-    """Generate latency comparison across patterns and policies"""
-    data = collect_pressure_curve_data()
-    node_capacity = get_node_capacity()
+            # Prepare data for grouped bar chart (0 = no data, e.g. killed)
+            membind_vals = np.array([membind.get(size, (0, 0))[0] for size in all_sizes], dtype=np.float64)
+            preferred_vals = np.array([preferred.get(size, (0, 0))[0] for size in all_sizes], dtype=np.float64)
 
-    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
-    patterns = ['sequential', 'random', 'stride']
-    pattern_titles = ['Sequential Access', 'Random Access', 'Stride Access']
+            plot_grouped_metric(axes[idx], pattern_titles[idx], all_sizes, membind_vals, preferred_vals,
+                                'Memory Size', 'Throughput (MB/s)', False, node_capacity)
 
-    for idx, pattern in enumerate(patterns):
-        ax = axes[idx]
+        fig.suptitle('Throughput - Memory Pressure & Fallback Behavior',
+                     fontsize=16, fontweight='bold')
+        fig.savefig('category1_throughput_pressure.png', dpi=200, bbox_inches='tight')
+        print("✓ Saved: category1_throughput_pressure.png")
+    finally:
+        plt.close(fig)
 
-        # Get all unique sizes
-        all_sizes = sorted(set(data['membind'][pattern]['sizes'] + data['preferred'][pattern]['sizes']))
+def plot_latency_pressure(data, node_capacity):
+    """Generate latency comparison across patterns and policies
 
-        if not all_sizes:
-            continue
+    Takes the same arguments as plot_throughput_pressure.
+    """
+    if not any(sizes for patterns in data.values() for sizes in patterns.values()):
+        print("No data found for membind/preferred pressure tests")
+        return
 
-        # Prepare data
-        membind_vals = []
-        preferred_vals = []
+    if is_up_to_date('category1_latency_pressure.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category1_latency_pressure.png")
+        return
 
-        for size in all_sizes:
-            if size in data['membind'][pattern]['sizes']:
-                idx_mb = data['membind'][pattern]['sizes'].index(size)
-                membind_vals.append(data['membind'][pattern]['latency'][idx_mb])
-            else:
-                membind_vals.append(0)
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6), constrained_layout=True)
+    try:
+        patterns = ['sequential', 'random', 'stride']
+        pattern_titles = ['Sequential Access', 'Random Access', 'Stride Access']
 
-            if size in data['preferred'][pattern]['sizes']:
-                idx_pf = data['preferred'][pattern]['sizes'].index(size)
-                preferred_vals.append(data['preferred'][pattern]['latency'][idx_pf])
-            else:
-                preferred_vals.append(0)
+        for idx, pattern in enumerate(patterns):
+            membind = data['membind'][pattern]
+            preferred = data['preferred'][pattern]
 
-        # Create discrete x positions
-        x = np.arange(len(all_sizes))
-        width = 0.35
-
-        # Plot bars
-        bars1 = ax.bar(x - width/2, membind_vals, width, label='Membind (Strict)',
-                       color='#ff7f0e', alpha=0.8)
-        bars2 = ax.bar(x + width/2, preferred_vals, width, label='Preferred (Fallback)',
-                       color='#2ca02c', alpha=0.8)
-
-        # Add degradation arrow for preferred policy
-        if len(preferred_vals) >= 2:
-            baseline_val = preferred_vals[0]
-            final_val = preferred_vals[-1]
-            if baseline_val > 0 and final_val > 0:
-                increase_pct = ((final_val - baseline_val) / baseline_val) * 100
-
-                # Draw arrow
-                arrow_props = dict(arrowstyle='->', color='red', lw=2.5, alpha=0.7)
-                ax.annotate('',
-                           xy=(len(all_sizes)-1 + width/2, final_val),
-                           xytext=(0 + width/2, baseline_val),
-                           arrowprops=arrow_props)
-
-                # Add label
-                mid_x = len(all_sizes) / 2
-                mid_y = (baseline_val + final_val) / 2
-                ax.text(mid_x, mid_y, f'↑{increase_pct:.0f}%',
-                       fontsize=13, color='red', fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.4', facecolor='white',
-                                edgecolor='red', alpha=0.9, linewidth=2))
-
-        # Formatting
-        ax.set_xlabel('Memory Allocation Size', fontsize=13, fontweight='bold')
-        ax.set_ylabel('Average Latency (ns)', fontsize=13, fontweight='bold')
-        ax.set_title(pattern_titles[idx], fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.tick_params(axis='x', labelsize=13)
-        ax.set_xticklabels([format_size_label(s) for s in all_sizes], rotation=45, ha='right')
-        ax.legend(fontsize=14)
-        ax.grid(True, alpha=0.3, axis='y')
-
-        # Add pivot point if detected
-        if node_capacity:
-            for i, size in enumerate(all_sizes):
-                if size >= node_capacity:
-                    ax.axvline(x=i-0.5, color='gray', linestyle=':', linewidth=2, alpha=0.7)
-                    break
-
-    plt.suptitle('Latency - Memory Pressure & Fallback Behavior',
-                 fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('category1_latency_pressure.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category1_latency_pressure.png")
-    plt.close()
-
-def plot_preferred_fallback_counters():
-    """Generate performance counter bar charts (Finding 2)"""
-    data = collect_preferred_counter_data()
-    node_capacity = get_node_capacity()
+            # Get all unique sizes
+            size_keys = membind.keys() | preferred.keys()
+
+            if not size_keys:
+                continue
+
+            all_sizes = np.fromiter(sorted(size_keys), dtype=np.int32, count=len(size_keys))
+
+            # Prepare data
+            membind_vals = np.array([membind.get(size, (0, 0))[1] for size in all_sizes], dtype=np.float64)
+            preferred_vals = np.array([preferred.get(size, (0, 0))[1] for size in all_sizes], dtype=np.float64)
+
+            plot_grouped_metric(axes[idx], pattern_titles[idx], all_sizes, membind_vals, preferred_vals,
+                                'Memory Allocation Size', 'Average Latency (ns)', True, node_capacity)
+
+        fig.suptitle('Latency - Memory Pressure & Fallback Behavior',
+                     fontsize=16, fontweight='bold')
+        fig.savefig('category1_latency_pressure.png', dpi=200, bbox_inches='tight')
+        print("✓ Saved: category1_latency_pressure.png")
+    finally:
+        plt.close(fig)
 
+def plot_preferred_fallback_counters(data, node_capacity):
+    """Generate performance counter bar charts (Finding 2)
+
+    data comes from collect_preferred_counter_data().
+    """
     if not data['sizes']:
         print("No data found for preferred policy random access tests")
         return
 
-    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
+    if is_up_to_date('category1_preferred_fallback_counters.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category1_preferred_fallback_counters.png")
+        return
 
-    counters = [
-        ('numa_miss', 'numa_miss', 'NUMA Miss (Wanted Local, Got Remote)', '#ff7f0e'),
-        ('numa_foreign', 'numa_foreign', 'NUMA Foreign (Remote Allocation Satisfied)', '#d62728'),
-        ('numa_pages_migrated', 'numa_pages_migrated', 'NUMA Pages Migrated', '#9467bd')
-    ]
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6), constrained_layout=True)
+    try:
+        counters = [
+            ('numa_miss', 'numa_miss', 'NUMA Miss (Wanted Local, Got Remote)', '#ff7f0e'),
+            ('numa_foreign', 'numa_foreign', 'NUMA Foreign (Remote Allocation Satisfied)', '#d62728'),
+            ('numa_pages_migrated', 'numa_pages_migrated', 'NUMA Pages Migrated', '#9467bd')
+        ]
 
-    # Create discrete x positions
-    x = np.arange(len(data['sizes']))
-
-    for idx, (key, label, title, color) in enumerate(counters):
-        ax = axes[idx]
-
-        # Plot bar chart
-        bars = ax.bar(x, data[key], color=color, alpha=0.8, edgecolor='black', linewidth=0.5)
-
-        # Add value labels on bars
-        for i, (bar, val) in enumerate(zip(bars, data[key])):
-            if val > 0:
-                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
-                       f'{val:,}', ha='center', va='bottom', fontsize=12)
-
-        # Add pivot point (node capacity) if detected
-        if node_capacity:
-            # Find the position where size >= node capacity
-            pivot_idx = None
-            for i, size in enumerate(data['sizes']):
-                if size >= node_capacity:
-                    pivot_idx = i
-                    break
-
-            if pivot_idx is not None:
-                # Draw vertical line before the pivot point
-                ax.axvline(x=pivot_idx - 0.5, color='red', linestyle='--',
-                          linewidth=2.5, alpha=0.7, label=f'Node Capacity ({format_size_label(node_capacity)})')
-
-                # Add text annotation (only on first subplot to avoid clutter)
-                # if idx == 0:
-                #     ax.text(pivot_idx - 0.5, ax.get_ylim()[1] * 0.95,
-                #            f'Pivot: {format_size_label(node_capacity)}\nFallback begins →',
-                #            fontsize=9, ha='right', va='top', color='red', fontweight='bold',
-                #            bbox=dict(boxstyle='round,pad=0.4', facecolor='yellow',
-                #                    edgecolor='red', alpha=0.8, linewidth=1.5))
-
-        # Formatting
-        ax.set_xlabel('Memory Allocation Size', fontsize=13, fontweight='bold')
-        ax.set_ylabel('Counter Value (Delta)', fontsize=13, fontweight='bold')
-        ax.set_title(title, fontsize=13, fontweight='bold')
-        ax.set_xticks(x)
-        ax.tick_params(axis='x', labelsize=13)
-        ax.set_xticklabels([format_size_label(s) for s in data['sizes']], rotation=45, ha='right')
-        ax.grid(True, alpha=0.3, axis='y')
-        if node_capacity and idx == 0:
-            ax.legend(fontsize=14, loc='upper left')
-
-    plt.suptitle('Performance Counter Evidence - Preferred Policy Fallback Under Random Access', fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('category1_preferred_fallback_counters.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category1_preferred_fallback_counters.png")
-    plt.close()
+        # Create discrete x positions
+        x = np.arange(len(data['sizes']))
+
+        for idx, (key, label, title, color) in enumerate(counters):
+            ax = axes[idx]
+
+            # Plot bar chart
+            bars = ax.bar(x, data[key], color=color, alpha=0.8, edgecolor='black', linewidth=0.5,
+                          rasterized=True)
+
+            # Add value labels on bars (one batched call; zero-valued bars stay unlabelled)
+            ax.bar_label(bars, labels=[f'{val:,}' if val > 0 else '' for val in data[key]],
+                         fontsize=12)
+
+            # Add pivot point (node capacity) if detected
+            if node_capacity:
+                # Find the position where size >= node capacity
+                pivot_idx = int(np.searchsorted(data['sizes'], node_capacity))
+
+                if pivot_idx < len(data['sizes']):
+                    # Draw vertical line before the pivot point
+                    ax.axvline(x=pivot_idx - 0.5, color='red', linestyle='--',
+                              linewidth=2.5, alpha=0.7, label=f'Node Capacity ({format_size_label(node_capacity)})')
+
+                    # Add text annotation (only on first subplot to avoid clutter)
+                    # if idx == 0:
+                    #     ax.text(pivot_idx - 0.5, ax.get_ylim()[1] * 0.95,
+                    #            f'Pivot: {format_size_label(node_capacity)}\nFallback begins →',
+                    #            fontsize=9, ha='right', va='top', color='red', fontweight='bold',
+                    #            bbox=dict(boxstyle='round,pad=0.4', facecolor='yellow',
+                    #                    edgecolor='red', alpha=0.8, linewidth=1.5))
+
+            # Formatting
+            ax.set_xlabel('Memory Allocation Size', fontsize=13, fontweight='bold')
+            ax.set_ylabel('Counter Value (Delta)', fontsize=13, fontweight='bold')
+            ax.set_title(title, fontsize=13, fontweight='bold')
+            ax.set_xticks(x)
+            ax.tick_params(axis='x', labelsize=13)
+            ax.set_xticklabels([format_size_label(s) for s in data['sizes']], rotation=45, ha='right')
+            ax.grid(True, alpha=0.3, axis='y')
+            if node_capacity and idx == 0:
+                ax.legend(fontsize=14, loc='upper left')
+
+        fig.suptitle('Performance Counter Evidence - Preferred Policy Fallback Under Random Access', fontsize=16, fontweight='bold')
+        fig.savefig('category1_preferred_fallback_counters.png', dpi=200, bbox_inches='tight')
+        print("✓ Saved: category1_preferred_fallback_counters.png")
+    finally:
+        plt.close(fig)
 
 if __name__ == '__main__':
     print("Generating Category 1 visualizations...")
     print()
 
-    # Generate all visualizations
-    plot_throughput_pressure()
-    plot_latency_pressure()
-    plot_preferred_fallback_counters()
+    # Collect everything once, then render the independent figures in parallel
+    pressure_data = collect_pressure_curve_data()
+    counter_data = collect_preferred_counter_data()
+    node_capacity = get_node_capacity()
+
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(plot_throughput_pressure, pressure_data, node_capacity),
+            executor.submit(plot_latency_pressure, pressure_data, node_capacity),
+            executor.submit(plot_preferred_fallback_counters, counter_data, node_capacity)
+        ]
+        # Surface any exception raised in a worker
+        for future in futures:
+            future.result()
 
     print()
     print("✓ Category 1 visualization complete!")
@@ -13,12 +13,26 @@ Outputs:
 
 import os
 import re
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever saved to PNG
 import numpy as np
+from plot_freshness import is_up_to_date
 
 RESULTS_DIR = "numa_results_advanced/Test2"
 MIN_SIZE_MB = 512  # Filter out small sizes where cache effects dominate
 
+# Only these vmstat counters are plotted; the rest of each snapshot is skipped while reading
+VMSTAT_KEYS = frozenset({'numa_local', 'numa_other'})
+
+# perf stat events read from each "1,234,567      cache-misses   # ..." counter line
+PERF_EVENTS = frozenset({'cache-misses', 'cache-references', 'dTLB-load-misses', 'dTLB-store-misses'})
+DROP_COMMAS = str.maketrans('', '', ',')  # "1,234,567" -> "1234567"
+
+# Result file names: local_node0_*MB_*.txt, remote_node0to1_*MB_*.txt, remote_node1to0_*MB_*.txt
+RESULT_PREFIXES = ('local_node0_', 'remote_node0to1_', 'remote_node1to0_')
+RESULT_FILE_RE = re.compile(r'(local_node0|remote_node0to1|remote_node1to0)_(\d+)MB_(sequential|random|stride)\.txt')
+
 def format_size_label(size_mb):
     """Convert MB to GB if >= 1024 MB for clearer labels"""
     if size_mb >= 1024:
@@ -28,72 +42,80 @@ def format_size_label(size_mb):
 
 def parse_perf_counters(filepath):
     """Extract perf counters from .perf file"""
-    try:
-        with open(filepath + '.perf', 'r') as f:
-            content = f.read()
-
-        counters = {}
-
-        # Parse cache counters
-        cache_misses_match = re.search(r'([\d,]+)\s+cache-misses', content)
-        cache_refs_match = re.search(r'([\d,]+)\s+cache-references', content)
-
-        if cache_misses_match and cache_refs_match:
-            counters['cache_misses'] = int(cache_misses_match.group(1).replace(',', ''))
-            counters['cache_references'] = int(cache_refs_match.group(1).replace(',', ''))
-
-            # Calculate cache miss rate
-            if counters['cache_references'] > 0:
-                counters['cache_miss_rate'] = (counters['cache_misses'] / counters['cache_references']) * 100
-            else:
-                counters['cache_miss_rate'] = 0
-
-        # Parse TLB counters
-        dtlb_load_match = re.search(r'([\d,]+)\s+dTLB-load-misses', content)
-        dtlb_store_match = re.search(r'([\d,]+)\s+dTLB-store-misses', content)
-
-        if dtlb_load_match and dtlb_store_match:
-            counters['dtlb_load_misses'] = int(dtlb_load_match.group(1).replace(',', ''))
-            counters['dtlb_store_misses'] = int(dtlb_store_match.group(1).replace(',', ''))
-            counters['total_tlb_misses'] = counters['dtlb_load_misses'] + counters['dtlb_store_misses']
-
-        return counters
-    except:
-        return {}
+    # Counter lines are ASCII; ignore anything else perf prints rather than decoding it
+    with open(filepath + '.perf', 'r', encoding='ascii', errors='ignore') as f:
+        content = f.read()
+
+    # perf stat lines are "<count> <event> ...": tokenising beats a regex scan here.
+    # "<not counted>" lines split into ['<not', 'counted>', ...] and are skipped.
+    # Modifier suffixes ("cache-misses:u") are dropped. Keeps the first reading of each event.
+    events = {}
+    for line in content.splitlines():
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        event = parts[1].partition(':')[0]
+        if event in PERF_EVENTS and event not in events:
+            events[event] = int(parts[0].translate(DROP_COMMAS))
+
+    counters = {}
+
+    # Cache counters
+    if 'cache-misses' in events and 'cache-references' in events:
+        misses = counters['cache_misses'] = events['cache-misses']
+        refs = counters['cache_references'] = events['cache-references']
+
+        # Calculate cache miss rate
+        if refs > 0:
+            counters['cache_miss_rate'] = (misses / refs) * 100
+        else:
+            counters['cache_miss_rate'] = 0
+
+    # TLB counters
+    if 'dTLB-load-misses' in events and 'dTLB-store-misses' in events:
+        counters['dtlb_load_misses'] = events['dTLB-load-misses']
+        counters['dtlb_store_misses'] = events['dTLB-store-misses']
+        counters['total_tlb_misses'] = counters['dtlb_load_misses'] + counters['dtlb_store_misses']
+
+    return counters
+
+def read_vmstat(path):
+    """Read the VMSTAT_KEYS counters from a /proc/vmstat snapshot ("name value" lines)"""
+    # Snapshots are a few KB: one read and split beats buffered line iteration
+    with open(path, 'r', encoding='ascii') as f:
+        lines = f.read().splitlines()
+
+    counters = {}
+    for line in lines:
+        key, _, value = line.partition(' ')
+        if key in VMSTAT_KEYS:
+            counters[key] = int(value)
+    return counters
 
 def parse_vmstat_delta(filepath):
     """Calculate NUMA counter deltas from vmstat_before and vmstat_after files"""
-    try:
-        vmstat_before = {}
-        vmstat_after = {}
-
-        # Read before
-        with open(filepath + '.vmstat_before', 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    vmstat_before[parts[0]] = int(parts[1])
-
-        # Read after
-        with open(filepath + '.vmstat_after', 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    vmstat_after[parts[0]] = int(parts[1])
-
-        # Calculate deltas
-        deltas = {}
-        for key in vmstat_after:
-            if key in vmstat_before:
-                deltas[key] = vmstat_after[key] - vmstat_before[key]
-
-        return deltas
-    except:
-        return {}
-
-def collect_tlb_data():
-    """Collect TLB data for all test configurations"""
-    data = {
+    vmstat_before = read_vmstat(filepath + '.vmstat_before')
+    vmstat_after = read_vmstat(filepath + '.vmstat_after')
+
+    # Calculate deltas
+    return {key: after - vmstat_before[key]
+            for key, after in vmstat_after.items() if key in vmstat_before}
+
+def parse_result_files(filepath, with_perf, with_vmstat):
+    """Return (perf counters, vmstat deltas) for one result; either is {} when not requested"""
+    counters = parse_perf_counters(filepath) if with_perf else {}
+    vmstat_deltas = parse_vmstat_delta(filepath) if with_vmstat else {}
+    return counters, vmstat_deltas
+
+def collect_counter_data():
+    """Collect TLB and NUMA allocation data in a single pass over RESULTS_DIR
+
+    Returns (tlb_data, numa_data):
+    - tlb_data: {config: {pattern: {'sizes', 'total_tlb_misses'}}} for all configs and patterns
+    - numa_data: {config: {'sizes', 'numa_local', 'numa_other'}} for the random pattern only
+    Each result file has its .perf parsed once and (random pattern only) its vmstat files once.
+    """
+    tlb_data = {
         'local': {},
         'remote_0to1': {},
         'remote_1to0': {}
@@ -101,283 +123,269 @@ def collect_tlb_data():
 
     for config in ['local', 'remote_0to1', 'remote_1to0']:
         for pattern in ['sequential', 'random', 'stride']:
-            data[config][pattern] = {
+            tlb_data[config][pattern] = {
                 'sizes': [],
                 'total_tlb_misses': []
             }
 
-    # Scan all result files
-    for filename in os.listdir(RESULTS_DIR):
-        # Match: local_node0_*MB_*.txt, remote_node0to1_*MB_*.txt, remote_node1to0_*MB_*.txt
-        match = re.match(r'(local_node0|remote_node0to1|remote_node1to0)_(\d+)MB_(sequential|random|stride)\.txt', filename)
-        if match:
-            config_raw = match.group(1)
-            size_mb = int(match.group(2))
-            pattern = match.group(3)
-
-            # Skip small sizes and sizes > 64GB
-            if size_mb < MIN_SIZE_MB or size_mb > 65536:
-                continue
-
-            # Map config name
-            config_map = {
-                'local_node0': 'local',
-                'remote_node0to1': 'remote_0to1',
-                'remote_node1to0': 'remote_1to0'
-            }
-            config = config_map[config_raw]
-
-            filepath = os.path.join(RESULTS_DIR, filename)
-            counters = parse_perf_counters(filepath)
-
-            if counters and 'total_tlb_misses' in counters:
-                data[config][pattern]['sizes'].append(size_mb)
-                data[config][pattern]['total_tlb_misses'].append(counters['total_tlb_misses'])
-
-    # Sort by size
-    for config in data:
-        for pattern in data[config]:
-            if data[config][pattern]['sizes']:
-                # Sort all lists together by size
-                sorted_data = sorted(zip(
-                    data[config][pattern]['sizes'],
-                    data[config][pattern]['total_tlb_misses']
-                ))
-
-                data[config][pattern]['sizes'] = [x[0] for x in sorted_data]
-                data[config][pattern]['total_tlb_misses'] = [x[1] for x in sorted_data]
-
-    return data
-
-def collect_numa_allocation_data():
-    """Collect NUMA allocation data for random access pattern only"""
     # Only collect local and one remote case (skip symmetric remote_1to0)
-    data = {
+    numa_data = {
         'local': {'sizes': [], 'numa_local': [], 'numa_other': []},
         'remote_0to1': {'sizes': [], 'numa_local': [], 'numa_other': []}
     }
 
-    # Scan files for random access pattern only
-    for filename in os.listdir(RESULTS_DIR):
-        match = re.match(r'(local_node0|remote_node0to1|remote_node1to0)_(\d+)MB_random\.txt', filename)
-        if match:
-            config_raw = match.group(1)
-            size_mb = int(match.group(2))
+    config_map = {
+        'local_node0': 'local',
+        'remote_node0to1': 'remote_0to1',
+        'remote_node1to0': 'remote_1to0'
+    }
 
-            # Skip small sizes and sizes > 64GB
-            if size_mb < MIN_SIZE_MB or size_mb > 65536:
-                continue
+    # Scan all result files
+    with os.scandir(RESULTS_DIR) as it:
+        entries = list(it)
 
-            # Skip symmetric case (remote_1to0)
-            if config_raw == 'remote_node1to0':
-                continue
+    # Every name in the directory, so results lacking a sidecar are skipped without an open()
+    available = {entry.name for entry in entries}
 
-            config_map = {
-                'local_node0': 'local',
-                'remote_node0to1': 'remote_0to1'
-            }
-            config = config_map[config_raw]
+    jobs = []  # (config, size_mb, pattern, filepath, with_perf, with_vmstat)
+    for entry in entries:
+        # Cheap string checks reject the .perf/.vmstat_* sidecars before the regex runs
+        if not entry.name.endswith('.txt') or not entry.name.startswith(RESULT_PREFIXES):
+            continue
 
-            filepath = os.path.join(RESULTS_DIR, filename)
-            vmstat_deltas = parse_vmstat_delta(filepath)
+        match = RESULT_FILE_RE.match(entry.name)
+        if not match:
+            continue
 
-            if 'numa_local' in vmstat_deltas and 'numa_other' in vmstat_deltas:
-                data[config]['sizes'].append(size_mb)
-                data[config]['numa_local'].append(vmstat_deltas['numa_local'])
-                data[config]['numa_other'].append(vmstat_deltas['numa_other'])
+        config = config_map[match.group(1)]
+        size_mb = int(match.group(2))
+        pattern = match.group(3)
 
-    # Sort by size
-    for config in data:
-        if data[config]['sizes']:
-            sorted_data = sorted(zip(
-                data[config]['sizes'],
-                data[config]['numa_local'],
-                data[config]['numa_other']
-            ))
+        # Skip small sizes and sizes > 64GB
+        if size_mb < MIN_SIZE_MB or size_mb > 65536:
+            continue
 
-            data[config]['sizes'] = [x[0] for x in sorted_data]
-            data[config]['numa_local'] = [x[1] for x in sorted_data]
-            data[config]['numa_other'] = [x[2] for x in sorted_data]
+        with_perf = entry.name + '.perf' in available
+        # NUMA allocation verification uses the random access pattern only
+        with_vmstat = (pattern == 'random' and config in numa_data and
+                       entry.name + '.vmstat_before' in available and
+                       entry.name + '.vmstat_after' in available)
 
-    return data
+        if with_perf or with_vmstat:
+            jobs.append((config, size_mb, pattern, entry.path, with_perf, with_vmstat))
 
-def plot_tlb_misses():
-    """Generate TLB miss count comparison"""
-    data = collect_tlb_data()
+    # Parse in worker processes (regex + int parsing is CPU-bound), then reduce here
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(parse_result_files,
+                               [job[3] for job in jobs],
+                               [job[4] for job in jobs],
+                               [job[5] for job in jobs],
+                               chunksize=16)
+
+        for (config, size_mb, pattern, *_), (counters, vmstat_deltas) in zip(jobs, results):
+            if counters and 'total_tlb_misses' in counters:
+                tlb_data[config][pattern]['sizes'].append(size_mb)
+                tlb_data[config][pattern]['total_tlb_misses'].append(counters['total_tlb_misses'])
+
+            if 'numa_local' in vmstat_deltas and 'numa_other' in vmstat_deltas:
+                numa_data[config]['sizes'].append(size_mb)
+                numa_data[config]['numa_local'].append(vmstat_deltas['numa_local'])
+                numa_data[config]['numa_other'].append(vmstat_deltas['numa_other'])
+
+    # Sort by size, leaving each TLB series as a pair of NumPy arrays
+    for config in tlb_data:
+        for series in tlb_data[config].values():
+            sizes = np.asarray(series['sizes'], dtype=np.int64)
+            order = np.argsort(sizes)
+            series['sizes'] = sizes[order]
+            series['total_tlb_misses'] = np.asarray(series['total_tlb_misses'], dtype=np.int64)[order]
+
+    for series in numa_data.values():
+        # One permutation applied to every parallel list (no tuple packing)
+        order = np.argsort(series['sizes'], kind='stable')
+        for key in ('sizes', 'numa_local', 'numa_other'):
+            series[key] = np.asarray(series[key], dtype=np.int64)[order].tolist()
+
+    return tlb_data, numa_data
+
+def align_to_sizes(all_sizes, series):
+    """Return series' TLB misses at each of all_sizes (sorted) as float64, 0 where it has no result"""
+    values = np.zeros(len(all_sizes), dtype=np.float64)
+    sizes = series['sizes']
+    if len(sizes):
+        pos = np.searchsorted(sizes, all_sizes).clip(max=len(sizes) - 1)
+        present = sizes[pos] == all_sizes
+        values[present] = series['total_tlb_misses'][pos[present]]
+    return values
+
+def plot_tlb_misses(data):
+    """Generate TLB miss count comparison from collect_counter_data()'s tlb_data"""
+    if is_up_to_date('category2_tlb_misses.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category2_tlb_misses.png")
+        return
+
+    import matplotlib.pyplot as plt  # Deferred: the collectors are usable without loading pyplot
 
     fig, axes = plt.subplots(1, 3, figsize=(20, 6))
-    patterns = ['sequential', 'random', 'stride']
-    pattern_titles = ['Sequential Access', 'Random Access', 'Stride Access']
+    try:
+        patterns = ['sequential', 'random', 'stride']
+        pattern_titles = ['Sequential Access', 'Random Access', 'Stride Access']
 
-    for idx, pattern in enumerate(patterns):
-        ax = axes[idx]
+        for idx, pattern in enumerate(patterns):
+            ax = axes[idx]
 
-        # Get all unique sizes
-        all_sizes = sorted(set(
-            data['local'][pattern]['sizes'] +
-            data['remote_0to1'][pattern]['sizes'] +
-            data['remote_1to0'][pattern]['sizes']
-        ))
+            # Get all unique sizes
+            all_sizes = np.unique(np.concatenate([
+                data['local'][pattern]['sizes'],
+                data['remote_0to1'][pattern]['sizes'],
+                data['remote_1to0'][pattern]['sizes']
+            ]))
 
-        if not all_sizes:
-            continue
+            if not len(all_sizes):
+                continue
 
-        # Prepare data
-        local_vals = []
-        remote_0to1_vals = []
-        remote_1to0_vals = []
-
-        for size in all_sizes:
-            # Local
-            if size in data['local'][pattern]['sizes']:
-                idx_local = data['local'][pattern]['sizes'].index(size)
-                local_vals.append(data['local'][pattern]['total_tlb_misses'][idx_local])
-            else:
-                local_vals.append(0)
-
-            # Remote 0→1
-            if size in data['remote_0to1'][pattern]['sizes']:
-                idx_r01 = data['remote_0to1'][pattern]['sizes'].index(size)
-                remote_0to1_vals.append(data['remote_0to1'][pattern]['total_tlb_misses'][idx_r01])
-            else:
-                remote_0to1_vals.append(0)
-
-            # Remote 1→0
-            if size in data['remote_1to0'][pattern]['sizes']:
-                idx_r10 = data['remote_1to0'][pattern]['sizes'].index(size)
-                remote_1to0_vals.append(data['remote_1to0'][pattern]['total_tlb_misses'][idx_r10])
-            else:
-                remote_1to0_vals.append(0)
-
-        # Create grouped bar chart
-        x = np.arange(len(all_sizes))
-        width = 0.25
-
-        bars1 = ax.bar(x - width, local_vals, width, label='Local (node 0→0)',
-                       color='#2ca02c', alpha=0.8)
-        bars2 = ax.bar(x, remote_0to1_vals, width, label='Remote (node 0→1)',
-                       color='#ff7f0e', alpha=0.8)
-        bars3 = ax.bar(x + width, remote_1to0_vals, width, label='Remote (node 1→0)',
-                       color='#d62728', alpha=0.8)
-
-        # Add degradation arrows for first and last memory sizes only
-        # (98GB is already filtered out in data collection)
-        last_idx = len(all_sizes) - 1
-
-        # Draw arrows for first and last positions
-        for i in [0, last_idx]:
-            if i < len(all_sizes):
-                local_val = local_vals[i]
-                remote_val = remote_0to1_vals[i]
-
-                if local_val > 0 and remote_val > 0:
-                    # Calculate percentage increase from local to remote
-                    increase_pct = ((remote_val - local_val) / local_val) * 100
-
-                    # Draw arrow from local bar to remote bar
-                    arrow_props = dict(arrowstyle='->', color='red', lw=2.5, alpha=0.7)
-                    ax.annotate('',
-                               xy=(i, remote_val),
-                               xytext=(i - width, local_val),
-                               arrowprops=arrow_props)
-
-                    # Add label
-                    mid_y = (local_val + remote_val) / 2
-                    ax.text(i - width/2, mid_y, f'↑{increase_pct:.0f}%',
-                           fontsize=12, color='red', fontweight='bold',
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
-                                    edgecolor='red', alpha=0.9, linewidth=2))
-
-        # Formatting
-        ax.set_xlabel('Memory Allocation Size', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Total TLB Misses (load + store)', fontsize=12, fontweight='bold')
-        ax.set_title(pattern_titles[idx], fontsize=12, fontweight='bold')
-        ax.set_xticks(x)
-        ax.tick_params(axis='x', labelsize=13)
-        ax.set_xticklabels([format_size_label(s) for s in all_sizes], rotation=45, ha='right')
-        ax.legend(fontsize=14)
-        ax.grid(True, alpha=0.3, axis='y')
-
-    plt.suptitle('TLB Misses - Local vs Remote Memory Access',
-                 fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('category2_tlb_misses.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category2_tlb_misses.png")
-    plt.close()
-
-def plot_numa_allocation_verification():
-    """Generate NUMA allocation verification for random access pattern"""
-    data = collect_numa_allocation_data()
+            # Prepare data (0 where a config has no result)
+            local_vals = align_to_sizes(all_sizes, data['local'][pattern])
+            remote_0to1_vals = align_to_sizes(all_sizes, data['remote_0to1'][pattern])
+            remote_1to0_vals = align_to_sizes(all_sizes, data['remote_1to0'][pattern])
+
+            # Create grouped bar chart
+            x = np.arange(len(all_sizes))
+            width = 0.25
+
+            bars1 = ax.bar(x - width, local_vals, width, label='Local (node 0→0)',
+                           color='#2ca02c', alpha=0.8)
+            bars2 = ax.bar(x, remote_0to1_vals, width, label='Remote (node 0→1)',
+                           color='#ff7f0e', alpha=0.8)
+            bars3 = ax.bar(x + width, remote_1to0_vals, width, label='Remote (node 1→0)',
+                           color='#d62728', alpha=0.8)
+
+            # Percentage increase from local to remote, for every size at once (0 without a local result)
+            increase_pct_arr = np.divide(remote_0to1_vals - local_vals, local_vals,
+                                         out=np.zeros(len(all_sizes)), where=local_vals > 0) * 100
+
+            # Add degradation arrows for first and last memory sizes only
+            # (98GB is already filtered out in data collection)
+            last_idx = len(all_sizes) - 1
+
+            # Draw arrows for first and last positions
+            for i in [0, last_idx]:
+                if i < len(all_sizes):
+                    local_val = local_vals[i]
+                    remote_val = remote_0to1_vals[i]
+
+                    if local_val > 0 and remote_val > 0:
+                        increase_pct = increase_pct_arr[i]
+
+                        # Draw arrow from local bar to remote bar
+                        arrow_props = dict(arrowstyle='->', color='red', lw=2.5, alpha=0.7)
+                        ax.annotate('',
+                                   xy=(i, remote_val),
+                                   xytext=(i - width, local_val),
+                                   arrowprops=arrow_props)
+
+                        # Add label
+                        mid_y = (local_val + remote_val) / 2
+                        ax.text(i - width/2, mid_y, f'↑{increase_pct:.0f}%',
+                               fontsize=12, color='red', fontweight='bold',
+                               bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                                        edgecolor='red', alpha=0.9, linewidth=2))
+
+            # Formatting
+            ax.set_xlabel('Memory Allocation Size', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Total TLB Misses (load + store)', fontsize=12, fontweight='bold')
+            ax.set_title(pattern_titles[idx], fontsize=12, fontweight='bold')
+            ax.set_xticks(x)
+            ax.tick_params(axis='x', labelsize=13)
+            ax.set_xticklabels([format_size_label(s) for s in all_sizes], rotation=45, ha='right')
+            ax.legend(fontsize=14)
+            ax.grid(True, alpha=0.3, axis='y')
+
+        fig.suptitle('TLB Misses - Local vs Remote Memory Access',
+                     fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        fig.savefig('category2_tlb_misses.png', dpi=300, bbox_inches='tight')
+        print("✓ Saved: category2_tlb_misses.png")
+    finally:
+        plt.close(fig)
+
+def plot_numa_allocation_verification(data):
+    """Generate NUMA allocation verification from collect_counter_data()'s numa_data"""
+    if is_up_to_date('category2_numa_allocation_verification.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category2_numa_allocation_verification.png")
+        return
+
+    import matplotlib.pyplot as plt  # Deferred: the collectors are usable without loading pyplot
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-    configs = ['local', 'remote_0to1']
-    config_titles = [
-        'Local (CPU node 0, Mem node 0)',
-        'Remote (CPU node 0, Mem node 1)'
-    ]
+    try:
+        configs = ['local', 'remote_0to1']
+        config_titles = [
+            'Local (CPU node 0, Mem node 0)',
+            'Remote (CPU node 0, Mem node 1)'
+        ]
 
-    for idx, (config, title) in enumerate(zip(configs, config_titles)):
-        ax = axes[idx]
+        for idx, (config, title) in enumerate(zip(configs, config_titles)):
+            ax = axes[idx]
 
-        if not data[config]['sizes']:
-            continue
+            if not data[config]['sizes']:
+                continue
 
-        sizes = data[config]['sizes']
-        numa_local = data[config]['numa_local']
-        numa_other = data[config]['numa_other']
-
-        # Create discrete x positions
-        x = np.arange(len(sizes))
-        width = 0.6
-
-        # Stacked bar chart
-        bars1 = ax.bar(x, numa_local, width, label='numa_local',
-                       color='#2ca02c', alpha=0.8)
-        bars2 = ax.bar(x, numa_other, width, bottom=numa_local,
-                       label='numa_other', color='#d62728', alpha=0.8)
-
-        # Add percentage labels in black for better clarity
-        for i, (local, other) in enumerate(zip(numa_local, numa_other)):
-            total = local + other
-            if total > 0:
-                local_pct = (local / total) * 100
-                other_pct = (other / total) * 100
-
-                # Label for numa_local
-                if local_pct > 5:  # Only show if significant
-                    ax.text(i, local / 2, f'{local_pct:.0f}%',
-                           ha='center', va='center', fontsize=12, fontweight='bold', color='black')
-
-                # Label for numa_other
-                if other_pct > 5:  # Only show if significant
-                    ax.text(i, local + other / 2, f'{other_pct:.0f}%',
-                           ha='center', va='center', fontsize=12, fontweight='bold', color='black')
-
-        # Formatting
-        ax.set_xlabel('Memory Allocation Size', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Allocation Count (Delta)', fontsize=12, fontweight='bold')
-        ax.set_title(title, fontsize=12, fontweight='bold')
-        ax.set_xticks(x)
-        ax.tick_params(axis='x', labelsize=13)
-        ax.set_xticklabels([format_size_label(s) for s in sizes], rotation=45, ha='right')
-        ax.legend(fontsize=14, loc='upper right')
-        ax.grid(True, alpha=0.3, axis='y')
-
-    plt.suptitle('NUMA Allocation Verification (Random Access Pattern)\n' +
-                 'Confirms Correct CPU/Memory Binding',
-                 fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('category2_numa_allocation_verification.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category2_numa_allocation_verification.png")
-    plt.close()
+            sizes = data[config]['sizes']
+            numa_local = np.asarray(data[config]['numa_local'], dtype=np.int64)
+            numa_other = np.asarray(data[config]['numa_other'], dtype=np.int64)
+
+            # Create discrete x positions
+            x = np.arange(len(sizes))
+            width = 0.6
+
+            # Stacked bar chart
+            bars1 = ax.bar(x, numa_local, width, label='numa_local',
+                           color='#2ca02c', alpha=0.8)
+            bars2 = ax.bar(x, numa_other, width, bottom=numa_local,
+                           label='numa_other', color='#d62728', alpha=0.8)
+
+            # Percentages for every bar at once (0 where nothing was allocated)
+            totals = numa_local + numa_other
+            local_pct = np.divide(numa_local, totals, out=np.zeros(len(sizes)), where=totals > 0) * 100
+            other_pct = np.divide(numa_other, totals, out=np.zeros(len(sizes)), where=totals > 0) * 100
+
+            # Add percentage labels in black for better clarity, only where significant (> 5%)
+            for i in np.flatnonzero(local_pct > 5):
+                ax.text(i, numa_local[i] / 2, f'{local_pct[i]:.0f}%',
+                       ha='center', va='center', fontsize=12, fontweight='bold', color='black')
+
+            for i in np.flatnonzero(other_pct > 5):
+                ax.text(i, numa_local[i] + numa_other[i] / 2, f'{other_pct[i]:.0f}%',
+                       ha='center', va='center', fontsize=12, fontweight='bold', color='black')
+
+            # Formatting
+            ax.set_xlabel('Memory Allocation Size', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Allocation Count (Delta)', fontsize=12, fontweight='bold')
+            ax.set_title(title, fontsize=12, fontweight='bold')
+            ax.set_xticks(x)
+            ax.tick_params(axis='x', labelsize=13)
+            ax.set_xticklabels([format_size_label(s) for s in sizes], rotation=45, ha='right')
+            ax.legend(fontsize=14, loc='upper right')
+            ax.grid(True, alpha=0.3, axis='y')
+
+        fig.suptitle('NUMA Allocation Verification (Random Access Pattern)\n' +
+                     'Confirms Correct CPU/Memory Binding',
+                     fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        fig.savefig('category2_numa_allocation_verification.png', dpi=300, bbox_inches='tight')
+        print("✓ Saved: category2_numa_allocation_verification.png")
+    finally:
+        plt.close(fig)
 
 if __name__ == '__main__':
     print("Generating Category 2 performance counter visualizations...")
     print()
 
-    # Generate visualizations
-    plot_tlb_misses()
-    plot_numa_allocation_verification()
+    # Parse every result file once, then generate visualizations
+    tlb_data, numa_data = collect_counter_data()
+    plot_tlb_misses(tlb_data)
+    plot_numa_allocation_verification(numa_data)
 
     print()
     print("✓ Category 2 performance counter visualization complete!")
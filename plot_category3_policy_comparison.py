@@ -6,10 +6,28 @@ Compare interleave, localalloc, membind, and preferred policies
 
 import os
 import re
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever saved to PNG
 import numpy as np
+from plot_freshness import is_up_to_date
 
 RESULTS_DIR = "numa_results_advanced/Test3"
+PATTERNS = ['sequential', 'random', 'stride']
+POLICIES = ['interleave', 'wt-interleave', 'localalloc', 'membind', 'preferred']
+
+THROUGHPUT_RE = re.compile(r'Throughput:\s+([\d.]+)\s+MB/s')
+
+# Parse filenames: interleave_all_512MB_sequential.txt, localalloc_node0_512MB_sequential.txt, etc.
+POLICY_FILE_RE = re.compile(r'(?P<policy>interleave_all|wt_interleave_all|localalloc_node0|membind_strict_node0|preferred_node0_cpu_node1)'
+                            r'_(?P<size>\d+)MB_(?P<pattern>sequential|random|stride)\.txt')
+POLICY_NAMES = {
+    'interleave_all': 'interleave',
+    'wt_interleave_all': 'wt-interleave',
+    'localalloc_node0': 'localalloc',
+    'membind_strict_node0': 'membind',
+    'preferred_node0_cpu_node1': 'preferred',
+}
 
 def parse_result_file(filepath):
     """Extract throughput from result file"""
@@ -17,42 +35,54 @@ def parse_result_file(filepath):
         with open(filepath, 'r') as f:
             content = f.read()
 
-        throughput_match = re.search(r'Throughput:\s+([\d.]+)\s+MB/s', content)
+        throughput_match = THROUGHPUT_RE.search(content)
         return float(throughput_match.group(1)) if throughput_match else None
     except:
         return None
 
 def collect_data():
-    """Collect data for different policies"""
-    data = {}  # {size: {pattern: {policy: throughput}}}
-
-    for filename in sorted(os.listdir(RESULTS_DIR)):
-        # Parse filenames: interleave_all_512MB_sequential.txt, localalloc_node0_512MB_sequential.txt, etc.
-        patterns = [
-            (r'interleave_all_(\d+)MB_(sequential|random|stride)\.txt', 'interleave'),
-            (r'wt_interleave_all_(\d+)MB_(sequential|random|stride)\.txt', 'wt-interleave'),
-            (r'localalloc_node0_(\d+)MB_(sequential|random|stride)\.txt', 'localalloc'),
-            (r'membind_strict_node0_(\d+)MB_(sequential|random|stride)\.txt', 'membind'),
-            (r'preferred_node0_cpu_node1_(\d+)MB_(sequential|random|stride)\.txt', 'preferred'),
-        ]
-
-        for pattern_regex, policy_name in patterns:
-            match = re.match(pattern_regex, filename)
-            if match:
-                size_mb = int(match.group(1))
-                access_pattern = match.group(2)
-
-                filepath = os.path.join(RESULTS_DIR, filename)
-                throughput = parse_result_file(filepath)
-
-                if throughput is not None and size_mb <= 100250:
-                    if size_mb not in data:
-                        data[size_mb] = {}
-                    if access_pattern not in data[size_mb]:
-                        data[size_mb][access_pattern] = {}
-                    data[size_mb][access_pattern][policy_name] = throughput
-
-    return data
+    """Collect throughput for different policies
+
+    Returns (sizes, throughput): sorted sizes and a (size, PATTERNS, POLICIES)
+    float array, NaN where there is no result.
+    """
+    records = []  # (size_mb, access_pattern, policy_name, throughput)
+
+    jobs = []  # (size_mb, access_pattern, policy_name, filepath)
+    # Order doesn't matter: results are placed into the table by size/pattern/policy
+    for filename in os.listdir(RESULTS_DIR):
+        # Cheap suffix check rejects the .perf/.vmstat_* sidecars before the regex runs
+        if not filename.endswith('.txt'):
+            continue
+
+        match = POLICY_FILE_RE.match(filename)
+        if not match:
+            continue
+
+        size_mb = int(match.group('size'))
+        if size_mb <= 100250:
+            jobs.append((size_mb, match.group('pattern'), POLICY_NAMES[match.group('policy')],
+                         os.path.join(RESULTS_DIR, filename)))
+
+    # Parse in worker processes (regex + float parsing is CPU-bound), then reduce here
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(parse_result_file, [job[3] for job in jobs], chunksize=16)
+
+        for (size_mb, access_pattern, policy_name, _), throughput in zip(jobs, results):
+            if throughput is not None:
+                records.append((size_mb, access_pattern, policy_name, throughput))
+
+    # Lay results out as a dense table indexed by integer codes
+    sizes = sorted({record[0] for record in records})
+    size_idx = {size: i for i, size in enumerate(sizes)}
+    pattern_idx = {pattern: i for i, pattern in enumerate(PATTERNS)}
+    policy_idx = {policy: i for i, policy in enumerate(POLICIES)}
+
+    throughput_table = np.full((len(sizes), len(PATTERNS), len(POLICIES)), np.nan)
+    for size_mb, access_pattern, policy_name, throughput in records:
+        throughput_table[size_idx[size_mb], pattern_idx[access_pattern], policy_idx[policy_name]] = throughput
+
+    return sizes, throughput_table
 
 def format_size_label(size_mb):
     """Convert MB to GB if >= 1024 MB for clearer labels"""
@@ -63,10 +93,13 @@ def format_size_label(size_mb):
 
 def plot_policy_comparison():
     """Create policy comparison plots"""
-    data = collect_data()
-    sizes = sorted(data.keys())
-    patterns = ['sequential', 'random', 'stride']
-    policies = ['interleave', 'wt-interleave', 'localalloc', 'membind', 'preferred']
+    if is_up_to_date('category3_policy_comparison.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category3_policy_comparison.png")
+        return
+
+    import matplotlib.pyplot as plt  # Deferred: the collectors are usable without loading pyplot
+
+    sizes, throughput_table = collect_data()
 
     colors = {
         'interleave': '#1f77b4',
@@ -87,41 +120,36 @@ def plot_policy_comparison():
 
     # Create subplots for each access pattern
     fig, axes = plt.subplots(1, 3, figsize=(18, 5))
-
-    for ax, pattern in zip(axes, patterns):
-        # Use discrete x positions for categorical labels (same as Category 2)
-        x = np.arange(len(sizes))
-
-        for policy in policies:
-            policy_data = []
-            for size in sizes:
-                if pattern in data[size] and policy in data[size][pattern]:
-                    policy_data.append(data[size][pattern][policy])
-                else:
-                    policy_data.append(None)
-
-            # Plot using discrete x positions
-            if any(d is not None for d in policy_data):
-                # Replace None with NaN for plotting
-                plot_data = [d if d is not None else np.nan for d in policy_data]
-                ax.plot(x, plot_data, 'o-', linewidth=2, markersize=8,
-                       label=policy_labels[policy], color=colors[policy])
-
-        ax.set_xlabel('Memory Allocation Size', fontsize=13, fontweight='bold')
-        ax.set_ylabel('Throughput (MB/s)', fontsize=13, fontweight='bold')
-        ax.set_title(f'{pattern.capitalize()} Access', fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.tick_params(axis='x', labelsize=13)
-        ax.set_xticklabels([format_size_label(s) for s in sizes], rotation=45, ha='right')
-        ax.legend(fontsize=12, framealpha=0.5, loc='upper right')
-        ax.grid(True, alpha=0.8)
-
-    plt.suptitle('NUMA Policy Performance Comparison',
-                 fontsize=16, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig('category3_policy_comparison.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category3_policy_comparison.png")
-    plt.show()
+    try:
+        for pattern_i, (ax, pattern) in enumerate(zip(axes, PATTERNS)):
+            # Use discrete x positions for categorical labels (same as Category 2)
+            x = np.arange(len(sizes))
+
+            for policy_i, policy in enumerate(POLICIES):
+                # NaN marks sizes without a result for this policy (matplotlib leaves a gap)
+                plot_data = throughput_table[:, pattern_i, policy_i]
+
+                # Plot using discrete x positions
+                if not np.isnan(plot_data).all():
+                    ax.plot(x, plot_data, 'o-', linewidth=2, markersize=8,
+                           label=policy_labels[policy], color=colors[policy])
+
+            ax.set_xlabel('Memory Allocation Size', fontsize=13, fontweight='bold')
+            ax.set_ylabel('Throughput (MB/s)', fontsize=13, fontweight='bold')
+            ax.set_title(f'{pattern.capitalize()} Access', fontsize=14, fontweight='bold')
+            ax.set_xticks(x)
+            ax.tick_params(axis='x', labelsize=13)
+            ax.set_xticklabels([format_size_label(s) for s in sizes], rotation=45, ha='right')
+            ax.legend(fontsize=12, framealpha=0.5, loc='upper right')
+            ax.grid(True, alpha=0.8)
+
+        fig.suptitle('NUMA Policy Performance Comparison',
+                     fontsize=16, fontweight='bold', y=1.02)
+        fig.tight_layout()
+        fig.savefig('category3_policy_comparison.png', dpi=300, bbox_inches='tight')
+        print("✓ Saved: category3_policy_comparison.png")
+    finally:
+        plt.close(fig)
 
 if __name__ == '__main__':
     plot_policy_comparison()
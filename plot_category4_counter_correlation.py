@@ -6,68 +6,98 @@ Correlate migration events (from vmstat) with performance metrics
 
 import os
 import re
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever saved to PNG
 import numpy as np
+from plot_freshness import is_up_to_date
 
 RESULTS_DIR = "numa_results_advanced/Test4"
 
+# Only these vmstat counters are reported; the rest of each snapshot is skipped while reading
+VMSTAT_KEYS = frozenset({'numa_pages_migrated', 'numa_pte_updates', 'pgmigrate_success'})
+
+THROUGHPUT_RE = re.compile(r'Throughput:\s+([\d.]+)\s+MB/s')
+# Migration test files: auto_numa_*MB[_pattern].txt, pressure_migration_*MB.txt, auto_migrated_*MB.txt
+MIGRATION_FILE_RE = re.compile(r'(auto_numa|pressure_migration|auto_migrated)_(\d+)MB(?:_(\w+))?\.txt')
+
 def parse_throughput(filepath):
     """Extract throughput from result file"""
     try:
         with open(filepath, 'r') as f:
             content = f.read()
 
-        throughput_match = re.search(r'Throughput:\s+([\d.]+)\s+MB/s', content)
+        throughput_match = THROUGHPUT_RE.search(content)
         return float(throughput_match.group(1)) if throughput_match else None
     except:
         return None
 
+def read_vmstat(path):
+    """Read the VMSTAT_KEYS counters from a /proc/vmstat snapshot ("name value" lines)
+
+    Returns None for an empty snapshot, which has nothing to correlate.
+    """
+    # Snapshots are a few KB: one read and split beats buffered line iteration
+    with open(path, 'r', encoding='ascii') as f:
+        lines = f.read().splitlines()
+    if not lines:
+        return None
+
+    counters = {}
+    for line in lines:
+        key, _, value = line.partition(' ')
+        if key in VMSTAT_KEYS:
+            counters[key] = int(value)
+    return counters
+
 def parse_vmstat_delta(filepath):
-    """Extract migration counters from vmstat before/after files"""
-    try:
-        vmstat_before = {}
-        vmstat_after = {}
-
-        # Read before
-        with open(filepath + '.vmstat_before', 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    vmstat_before[parts[0]] = int(parts[1])
-
-        # Read after
-        with open(filepath + '.vmstat_after', 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    vmstat_after[parts[0]] = int(parts[1])
-
-        # Calculate deltas
-        deltas = {}
-        for key in vmstat_after:
-            if key in vmstat_before:
-                deltas[key] = vmstat_after[key] - vmstat_before[key]
-
-        return deltas
-    except:
+    """Extract migration counters from vmstat before/after files
+
+    Every VMSTAT_KEYS counter is reported; one missing from either snapshot
+    counts as 0. Empty if either snapshot is empty.
+    """
+    vmstat_before = read_vmstat(filepath + '.vmstat_before')
+    vmstat_after = read_vmstat(filepath + '.vmstat_after')
+    if vmstat_before is None or vmstat_after is None:
         return {}
 
+    # Calculate deltas
+    return {key: vmstat_after[key] - vmstat_before[key]
+                 if key in vmstat_after and key in vmstat_before else 0
+            for key in VMSTAT_KEYS}
+
+def parse_migration_result(filepath):
+    """Return (throughput, vmstat deltas) for one migration test result"""
+    return parse_throughput(filepath), parse_vmstat_delta(filepath)
+
 def collect_correlation_data():
     """Collect data correlating migration events with performance"""
     data = []  # List of {scenario, size, throughput, numa_pages_migrated, numa_pte_updates}
 
-    for filename in sorted(os.listdir(RESULTS_DIR)):
-        # Parse all migration test files
-        match = re.match(r'(auto_numa|pressure_migration|auto_migrated)_(\d+)MB(?:_(\w+))?\.txt', filename)
-        if match:
+    filenames = sorted(os.listdir(RESULTS_DIR))
+    # Every name in the directory, so results lacking vmstat sidecars are skipped without an open()
+    available = set(filenames)
+
+    jobs = []  # (test_type, size_mb, pattern, filepath)
+    for filename in filenames:
+        # Cheap suffix check rejects the .perf/.vmstat_* sidecars before the regex runs
+        if not filename.endswith('.txt'):
+            continue
+
+        # Parse all migration test files (only those with both vmstat snapshots can correlate)
+        match = MIGRATION_FILE_RE.match(filename)
+        if match and filename + '.vmstat_before' in available and filename + '.vmstat_after' in available:
             test_type = match.group(1)
             size_mb = int(match.group(2))
             pattern = match.group(3) if match.group(3) else 'sequential'
 
-            filepath = os.path.join(RESULTS_DIR, filename)
-            throughput = parse_throughput(filepath)
-            vmstat_deltas = parse_vmstat_delta(filepath)
+            jobs.append((test_type, size_mb, pattern, os.path.join(RESULTS_DIR, filename)))
+
+    # Parse in worker processes (regex + int parsing is CPU-bound), then reduce here
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(parse_migration_result, [job[3] for job in jobs], chunksize=16)
 
+        for (test_type, size_mb, pattern, _), (throughput, vmstat_deltas) in zip(jobs, results):
             if throughput is not None and vmstat_deltas:
                 data.append({
                     'scenario': f'{test_type}\n{size_mb}MB\n{pattern}',
@@ -82,6 +112,56 @@ def collect_correlation_data():
 
     return data
 
+def pearson(x, y):
+    """Pearson correlation of x and y, or None if either is constant"""
+    xm = x - x.mean()
+    ym = y - y.mean()
+    denom = np.sqrt((xm * xm).sum() * (ym * ym).sum())
+    return float((xm * ym).sum() / denom) if denom > 0 else None
+
+def draw_counter_correlation(data_sorted, migrations, throughputs):
+    """Render the dual-axis correlation chart to category4_counter_correlation.png"""
+    import matplotlib.pyplot as plt  # Deferred: the collectors are usable without loading pyplot
+
+    fig, ax1 = plt.subplots(figsize=(16, 7))
+    try:
+        x = np.arange(len(data_sorted))
+        scenarios = [d['scenario_short'] for d in data_sorted]
+
+        # Plot migration events on left y-axis
+        color = 'tab:red'
+        ax1.set_xlabel('Test Scenario', fontsize=12, fontweight='bold')
+        ax1.set_ylabel('Pages Migrated', fontsize=12, fontweight='bold', color=color)
+        bars1 = ax1.bar(x - 0.2, migrations,
+                         width=0.4, label='Pages Migrated', color=color, alpha=0.7)
+        ax1.tick_params(axis='y', labelcolor=color)
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(scenarios, rotation=45, ha='right', fontsize=9)
+        ax1.grid(True, alpha=0.3, axis='y')
+
+        # Plot throughput on right y-axis
+        ax2 = ax1.twinx()
+        color = 'tab:blue'
+        ax2.set_ylabel('Throughput (MB/s)', fontsize=12, fontweight='bold', color=color)
+        bars2 = ax2.bar(x + 0.2, throughputs,
+                         width=0.4, label='Throughput', color=color, alpha=0.7)
+        ax2.tick_params(axis='y', labelcolor=color)
+
+        # Title and legend
+        ax2.set_title('Migration Activity vs Performance\n(Correlation between page migration and throughput)',
+                      fontsize=14, fontweight='bold', pad=20)
+
+        # Combined legend
+        lines1, labels1 = ax1.get_legend_handles_labels()
+        lines2, labels2 = ax2.get_legend_handles_labels()
+        ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=10)
+
+        fig.tight_layout()
+        fig.savefig('category4_counter_correlation.png', dpi=300, bbox_inches='tight')
+        print("✓ Saved: category4_counter_correlation.png")
+    finally:
+        plt.close(fig)
+
 def plot_counter_correlation():
     """Create counter correlation dual-axis plot"""
     data = collect_correlation_data()
@@ -98,43 +178,16 @@ def plot_counter_correlation():
         # Take a subset: auto-numa and auto-migrated for each size
         data_sorted = [d for d in data_sorted if 'auto' in d['test_type']][:15]
 
-    fig, ax1 = plt.subplots(figsize=(16, 7))
+    # Column arrays shared by the bars and the correlation below
+    migrations = np.fromiter((d['numa_pages_migrated'] for d in data_sorted),
+                             dtype=np.int64, count=len(data_sorted))
+    throughputs = np.fromiter((d['throughput'] for d in data_sorted),
+                              dtype=np.float64, count=len(data_sorted))
 
-    x = np.arange(len(data_sorted))
-    scenarios = [d['scenario_short'] for d in data_sorted]
-
-    # Plot migration events on left y-axis
-    color = 'tab:red'
-    ax1.set_xlabel('Test Scenario', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Pages Migrated', fontsize=12, fontweight='bold', color=color)
-    bars1 = ax1.bar(x - 0.2, [d['numa_pages_migrated'] for d in data_sorted],
-                     width=0.4, label='Pages Migrated', color=color, alpha=0.7)
-    ax1.tick_params(axis='y', labelcolor=color)
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(scenarios, rotation=45, ha='right', fontsize=9)
-    ax1.grid(True, alpha=0.3, axis='y')
-
-    # Plot throughput on right y-axis
-    ax2 = ax1.twinx()
-    color = 'tab:blue'
-    ax2.set_ylabel('Throughput (MB/s)', fontsize=12, fontweight='bold', color=color)
-    bars2 = ax2.bar(x + 0.2, [d['throughput'] for d in data_sorted],
-                     width=0.4, label='Throughput', color=color, alpha=0.7)
-    ax2.tick_params(axis='y', labelcolor=color)
-
-    # Title and legend
-    plt.title('Migration Activity vs Performance\n(Correlation between page migration and throughput)',
-             fontsize=14, fontweight='bold', pad=20)
-
-    # Combined legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=10)
-
-    plt.tight_layout()
-    plt.savefig('category4_counter_correlation.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category4_counter_correlation.png")
-    plt.show()
+    if is_up_to_date('category4_counter_correlation.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category4_counter_correlation.png")
+    else:
+        draw_counter_correlation(data_sorted, migrations, throughputs)
 
     # Print correlation analysis
     print("\n=== Counter Correlation Analysis ===")
@@ -148,11 +201,8 @@ def plot_counter_correlation():
 
     # Calculate correlation coefficient
     if len(data_sorted) > 3:
-        migrations = np.array([d['numa_pages_migrated'] for d in data_sorted])
-        throughputs = np.array([d['throughput'] for d in data_sorted])
-
-        if np.std(migrations) > 0 and np.std(throughputs) > 0:
-            correlation = np.corrcoef(migrations, throughputs)[0, 1]
+        correlation = pearson(migrations, throughputs)
+        if correlation is not None:
             print(f"\nPearson Correlation Coefficient: {correlation:.3f}")
 
             if correlation > 0.5:
@@ -5,181 +5,175 @@ Test Category 4: NUMA Page Migration Visualizations
 - Migration cost comparison (baseline vs static vs auto-migrated)
 """
 
-import os
 import re
-import matplotlib.pyplot as plt
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever saved to PNG
 import numpy as np
-
-RESULTS_DIR = "numa_results_advanced/Test4"
-
+from category4_common import (COST_KEYS, RESULTS_DIR, TIME_ELAPSED_RE, cached_by_mtime,
+                              format_size_label, parse_migration_test, parse_sequential_test,
+                              scan_results)
+from plot_freshness import is_up_to_date
+
+# Categories (as reported by scan_results) drawn on the timeline chart
+TIMELINE_CATEGORIES = frozenset({'auto_migrated', 'auto_numa',
+                                 'auto_migrated_timeline', 'auto_numa_timeline'})
+
+# Per-size timeline chart, formatted with the size in MB
+TIMELINE_PNG = 'category4_migration_timeline_{}MB.png'
+
+# Longest latency line drawn per timeline; longer runs are decimated before plotting
+MAX_LATENCY_POINTS = 1000
+
+# Timeline files are streamed as raw bytes lines; the CSV block starts at this header
+# (old Time(s) or new Iteration format) and runs until "Final distribution"
+TIMELINE_HEADER_RE = re.compile(rb'(Time\(s\)|Iteration), .*Node0%, Node1%, Status\n')
+
+# Row layouts of the timeline CSV, keyed by its first header column:
+# new format is Iteration, IterTime(s), Node0%, Node1%, Status;
+# old format is Time(s), Node0%, Node1%, Status (iteration is inferred)
+TIMELINE_CSV_DTYPES = {
+    b'Iteration': [('iteration', np.int64), ('time', np.float64),
+                   ('node0_pct', np.int64), ('node1_pct', np.int64), ('status', 'U16')],
+    b'Time(s)': [('time', np.float64),
+                 ('node0_pct', np.int64), ('node1_pct', np.int64), ('status', 'U16')],
+}
+
+# Stored by genfromtxt for numeric fields that fail to convert, so those rows can be dropped
+TIMELINE_CSV_INVALID = np.iinfo(np.int64).min
+
+# perf stat counters appended to each result file
+DTLB_LOAD_RE = re.compile(rb'([\d,]+)\s+dTLB-load-misses')
+DTLB_STORE_RE = re.compile(rb'([\d,]+)\s+dTLB-store-misses')
+PAGE_FAULTS_RE = re.compile(rb'([\d,]+)\s+page-faults')
+CACHE_MISSES_RE = re.compile(rb'([\d,]+)\s+cache-misses')
+USER_TIME_RE = re.compile(rb'([\d.]+)\s+seconds user')
+SYS_TIME_RE = re.compile(rb'([\d.]+)\s+seconds sys')
+
+def parse_perf_counters(buf):
+    """Extract the key perf stat counters from a result file buffer"""
+    perf_counters = {}
+
+    dtlb_load_match = DTLB_LOAD_RE.search(buf)
+    dtlb_store_match = DTLB_STORE_RE.search(buf)
+    page_faults_match = PAGE_FAULTS_RE.search(buf)
+    cache_misses_match = CACHE_MISSES_RE.search(buf)
+    time_elapsed_match = TIME_ELAPSED_RE.search(buf)
+    user_time_match = USER_TIME_RE.search(buf)
+    sys_time_match = SYS_TIME_RE.search(buf)
+
+    if dtlb_load_match:
+        perf_counters['dtlb_load_misses'] = int(dtlb_load_match.group(1).replace(b',', b''))
+    if dtlb_store_match:
+        perf_counters['dtlb_store_misses'] = int(dtlb_store_match.group(1).replace(b',', b''))
+    if page_faults_match:
+        perf_counters['page_faults'] = int(page_faults_match.group(1).replace(b',', b''))
+    if cache_misses_match:
+        perf_counters['cache_misses'] = int(cache_misses_match.group(1).replace(b',', b''))
+    if time_elapsed_match:
+        perf_counters['time_elapsed'] = float(time_elapsed_match.group(1))
+    if user_time_match:
+        perf_counters['user_time'] = float(user_time_match.group(1))
+    if sys_time_match:
+        perf_counters['sys_time'] = float(sys_time_match.group(1))
+
+    return perf_counters
+
+@cached_by_mtime
 def parse_migration_timeline(filepath):
     """Parse migration test output to extract timeline data"""
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        data = {
-            'iteration': [],
-            'time': [],
-            'node0_pct': [],
-            'node1_pct': [],
-            'status': []
-        }
+    mode = 'preamble'
+    csv_format = None
+    csv_lines = []
+    tail = []
 
-        # Find the CSV section (match both old and new formats)
-        csv_match = re.search(r'(Time\(s\)|Iteration), .*Node0%, Node1%, Status\n(.*?)Final distribution',
-                             content, re.DOTALL)
-
-        if csv_match:
-            csv_lines = csv_match.group(2).strip().split('\n')
-            for line in csv_lines:
-                parts = line.split(',')
-                if len(parts) >= 4:
-                    try:
-                        # New format: Iteration, IterTime(s), Node0%, Node1%, Status
-                        # Old format: Time(s), Node0%, Node1%, Status
-                        if len(parts) >= 5:  # New format
-                            iteration = int(parts[0].strip())
-                            iter_time = float(parts[1].strip())
-                            node0 = int(parts[2].strip())
-                            node1 = int(parts[3].strip())
-                            status = parts[4].strip() if len(parts) > 4 else ''
-                            data['iteration'].append(iteration)
-                            data['time'].append(iter_time)  # Per-iteration time
-                        else:  # Old format (no iteration number)
-                            time_s = float(parts[0].strip())
-                            node0 = int(parts[1].strip())
-                            node1 = int(parts[2].strip())
-                            status = parts[3].strip() if len(parts) > 3 else ''
-                            data['iteration'].append(len(data['iteration']))  # Infer iteration
-                            data['time'].append(time_s)
-
-                        data['node0_pct'].append(node0)
-                        data['node1_pct'].append(node1)
-                        data['status'].append(status)
-                    except ValueError:
-                        continue
-
-        # Also extract performance counters
-        perf_counters = {}
-
-        # Extract key performance counters
-        dtlb_load_match = re.search(r'([\d,]+)\s+dTLB-load-misses', content)
-        dtlb_store_match = re.search(r'([\d,]+)\s+dTLB-store-misses', content)
-        page_faults_match = re.search(r'([\d,]+)\s+page-faults', content)
-        cache_misses_match = re.search(r'([\d,]+)\s+cache-misses', content)
-        time_elapsed_match = re.search(r'([\d.]+)\s+seconds time elapsed', content)
-        user_time_match = re.search(r'([\d.]+)\s+seconds user', content)
-        sys_time_match = re.search(r'([\d.]+)\s+seconds sys', content)
-
-        if dtlb_load_match:
-            perf_counters['dtlb_load_misses'] = int(dtlb_load_match.group(1).replace(',', ''))
-        if dtlb_store_match:
-            perf_counters['dtlb_store_misses'] = int(dtlb_store_match.group(1).replace(',', ''))
-        if page_faults_match:
-            perf_counters['page_faults'] = int(page_faults_match.group(1).replace(',', ''))
-        if cache_misses_match:
-            perf_counters['cache_misses'] = int(cache_misses_match.group(1).replace(',', ''))
-        if time_elapsed_match:
-            perf_counters['time_elapsed'] = float(time_elapsed_match.group(1))
-        if user_time_match:
-            perf_counters['user_time'] = float(user_time_match.group(1))
-        if sys_time_match:
-            perf_counters['sys_time'] = float(sys_time_match.group(1))
-
-        data['perf_counters'] = perf_counters
-
-        return data if data['time'] else None
-    except:
-        return None
-
-def parse_sequential_test(filepath):
-    """Parse sequential test results for cost comparison"""
+    # Stream the file: skip the preamble, collect the CSV rows, then keep the
+    # short tail after the CSV, which is where perf stat writes its counters
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        # Extract throughput and time
-        throughput_match = re.search(r'Throughput:\s+([\d.]+)\s+MB/s', content)
-        latency_match = re.search(r'Average latency:\s+([\d.]+)\s+ns', content)
-        time_match = re.search(r'time elapsed\s*\n\s+([\d.]+)\s+seconds', content)
-
-        result = {}
-        if throughput_match:
-            result['throughput'] = float(throughput_match.group(1))
-        if latency_match:
-            result['latency'] = float(latency_match.group(1))
-        if time_match:
-            result['time'] = float(time_match.group(1))
-
-        return result if result else None
-    except:
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if mode == 'preamble':
+                    header_match = TIMELINE_HEADER_RE.match(line)
+                    if header_match:
+                        csv_format = header_match.group(1)
+                        mode = 'csv'
+                elif mode == 'csv' and not line.startswith(b'Final distribution'):
+                    csv_lines.append(line)
+                else:
+                    mode = 'tail'
+                    tail.append(line)
+    except OSError:
         return None
 
-def parse_migration_test(filepath):
-    """Parse migration test results"""
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        # Extract time from migration test
-        time_match = re.search(r'Time:\s+([\d.]+)\s+seconds', content)
-        elapsed_match = re.search(r'([\d.]+)\s+seconds time elapsed', content)
-
-        result = {}
-        if time_match:
-            result['time'] = float(time_match.group(1))
-        elif elapsed_match:
-            result['time'] = float(elapsed_match.group(1))
-
-        return result if result else None
-    except:
+    if mode != 'tail':
         return None
 
-def plot_migration_timeline():
-    """Generate migration timeline visualization with two separate graphs"""
-    # Collect data for all sizes
-    sizes = []
-    timelines = {}
-
-    for filename in os.listdir(RESULTS_DIR):
-        # Match both old and new naming patterns
-        match = re.match(r'auto_(migrated|numa)_(\d+)MB(_timeline)?\.txt', filename)
-        if match:
-            size_mb = int(match.group(2))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            data = parse_migration_timeline(filepath)
-
-            if data and data['time']:
-                sizes.append(size_mb)
-                timelines[size_mb] = data
-
-    if not sizes:
-        print("No migration timeline data found")
-        return
-
-    sizes.sort()
-
-    # Create visualization for each size
-    for size_mb in sizes:
-        data = timelines[size_mb]
-
-        iterations = np.array(data['iteration'])
-        iter_times = np.array(data['time'])
-        node0 = np.array(data['node0_pct'])
-        node1 = np.array(data['node1_pct'])
-        statuses = data['status']
+    # Parse the whole block in one call. Extra trailing columns are ignored; short
+    # rows are dropped (silently, as before) and so are rows with unparseable fields
+    dtype = TIMELINE_CSV_DTYPES[csv_format]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        rows = np.genfromtxt(csv_lines, delimiter=',', dtype=dtype, autostrip=True,
+                             usecols=range(len(dtype)), filling_values=TIMELINE_CSV_INVALID,
+                             invalid_raise=False, ndmin=1)
+    valid = np.ones(len(rows), dtype=bool)
+    for name in rows.dtype.names:
+        if rows.dtype[name].kind in 'if':
+            valid &= rows[name] != TIMELINE_CSV_INVALID
+    rows = rows[valid]
+    if not len(rows):
+        return None
 
-        # Create figure with 2 subplots (vertically stacked, equal height, tighter spacing)
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10),
-                                        gridspec_kw={'height_ratios': [1, 1], 'hspace': 0.25})
+    return {
+        'iteration': rows['iteration'] if 'iteration' in rows.dtype.names else np.arange(len(rows)),
+        'time': rows['time'],  # Per-iteration time (new format)
+        'node0_pct': rows['node0_pct'],
+        'node1_pct': rows['node1_pct'],
+        'status': rows['status'],
+        'perf_counters': parse_perf_counters(b''.join(tail))
+    }
+
+def decimate(x, y, target=MAX_LATENCY_POINTS):
+    """Reduce (x, y) to about target points, keeping the min and max of each bucket"""
+    if len(x) <= target:
+        return x, y
+
+    step = 2 * len(x) // target  # Two points survive per bucket
+    n = len(x) - len(x) % step
+    buckets = y[:n].reshape(-1, step)
+    starts = np.arange(0, n, step)
+    # Spikes survive as bucket extremes; the ragged tail is kept as-is
+    keep = np.unique(np.concatenate((starts + buckets.argmin(axis=1),
+                                     starts + buckets.argmax(axis=1),
+                                     np.arange(n, len(x)))))
+    return x[keep], y[keep]
+
+def render_timeline(size_mb, data):
+    """Draw and save the timeline figure for one size; returns the PNG name
+
+    Top-level so it can run in a worker process, each with its own figure.
+    """
+    import matplotlib.pyplot as plt  # Deferred: the parsers are usable without loading pyplot
+
+    iterations = data['iteration']
+    iter_times = data['time']
+    node0 = data['node0_pct']
+    node1 = data['node1_pct']
+    statuses = data['status']
+
+    # Create figure with 2 subplots (vertically stacked, equal height, tighter spacing)
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10),
+                                    gridspec_kw={'height_ratios': [1, 1]},
+                                    constrained_layout=True)
 
-        size_label = f"{size_mb // 1024} GB" if size_mb >= 1024 else f"{size_mb} MB"
+    try:
+        size_label = format_size_label(size_mb)
 
         # ========== TOP PANEL: Per-Iteration Latency ==========
 
-        # Plot per-iteration latency
-        ax1.plot(iterations, iter_times, color='#1f77b4',
+        # Plot per-iteration latency (decimated for long runs)
+        ax1.plot(*decimate(iterations, iter_times), color='#1f77b4',
                 linewidth=2.5, marker='o', markersize=2, label='Per-iteration Latency')
 
         ax1.set_ylabel('Latency per Iteration (seconds)', fontsize=12, fontweight='bold')
@@ -196,37 +190,25 @@ def plot_migration_timeline():
             'All_Local': '#aaffaa'    # Darker green
         }
 
-        current_status = None
-        phase_start = 0
-
-        for i, status in enumerate(statuses):
-            if status != current_status:
-                if current_status is not None and current_status in phase_colors:
-                    # Draw the previous phase
-                    ax1.axvspan(iterations[phase_start], iterations[i-1],
-                               color=phase_colors[current_status], alpha=1, zorder=0)
-                    ax2.axvspan(iterations[phase_start], iterations[i-1],
-                               color=phase_colors[current_status], alpha=1, zorder=0)
-                current_status = status
-                phase_start = i
-
-        # Draw the last phase
-        if current_status in phase_colors:
-            ax1.axvspan(iterations[phase_start], iterations[-1],
-                       color=phase_colors[current_status], alpha=1, zorder=0)
-            ax2.axvspan(iterations[phase_start], iterations[-1],
-                       color=phase_colors[current_status], alpha=1, zorder=0)
-
-        # Mark key transition points
-        migration_start_iter = None
-        migration_complete_iter = None
-
-        for i, (n0, status) in enumerate(zip(node0, statuses)):
-            if migration_start_iter is None and status == 'Migrating':
-                migration_start_iter = iterations[i]
-            if migration_complete_iter is None and status == 'All_Local':
-                migration_complete_iter = iterations[i]
-                break
+        # Phase boundaries: indices where the status changes, plus both ends
+        boundaries = np.concatenate(([0], np.flatnonzero(statuses[1:] != statuses[:-1]) + 1,
+                                     [len(statuses)]))
+
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            status = statuses[start]
+            if status in phase_colors:
+                ax1.axvspan(iterations[start], iterations[end - 1],
+                           color=phase_colors[status], alpha=1, zorder=0)
+                ax2.axvspan(iterations[start], iterations[end - 1],
+                           color=phase_colors[status], alpha=1, zorder=0, rasterized=True)
+
+        # Mark key transition points (a Migrating phase only counts before the first All_Local)
+        is_local = statuses == 'All_Local'
+        complete_idx = np.argmax(is_local) if is_local.any() else len(statuses)
+        is_migrating = statuses[:complete_idx] == 'Migrating'
+
+        migration_start_iter = iterations[np.argmax(is_migrating)] if is_migrating.any() else None
+        migration_complete_iter = iterations[complete_idx] if is_local.any() else None
 
         if migration_start_iter is not None:
             ax1.axvline(x=migration_start_iter, color='black', linestyle='--',
@@ -266,9 +248,12 @@ def plot_migration_timeline():
 
         # ========== BOTTOM PANEL: Page Distribution ==========
 
-        # Plot stacked area for page distribution (use blue/orange to distinguish from red/yellow/green backgrounds)
-        ax2.fill_between(iterations, node0, 100, color='#ff7f0e', alpha=1, label='Remote (Node 1)')  # Orange
-        ax2.fill_between(iterations, 0, node0, color='#1f77b4', alpha=1, label='Local (Node 0)')  # Blue
+        # Plot stacked area for page distribution (use blue/orange to distinguish from red/yellow/green backgrounds);
+        # the large fill polygons are rasterized while text, legend and axes stay vector
+        ax2.fill_between(iterations, node0, 100, color='#ff7f0e', alpha=1, label='Remote (Node 1)',
+                         rasterized=True)  # Orange
+        ax2.fill_between(iterations, 0, node0, color='#1f77b4', alpha=1, label='Local (Node 0)',
+                         rasterized=True)  # Blue
 
         ax2.set_xlabel('Iteration', fontsize=12, fontweight='bold')
         ax2.set_ylabel('Page Distribution (%)', fontsize=12, fontweight='bold')
@@ -287,132 +272,148 @@ def plot_migration_timeline():
             ax2.axvline(x=migration_complete_iter, color='black', linestyle='-.',
                        linewidth=2, alpha=0.8)
 
-        plt.tight_layout()
-        filename = f'category4_migration_timeline_{size_mb}MB.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✓ Saved: {filename}")
-        plt.close()
+        filename = TIMELINE_PNG.format(size_mb)
+        fig.savefig(filename, dpi=300)
+    finally:
+        plt.close(fig)
+
+    return filename
+
+def plot_migration_timeline():
+    """Generate migration timeline visualization with two separate graphs"""
+    # Collect data for all sizes
+    timelines = {}
+
+    for category, size_mb, filepath in scan_results():
+        # Match both old and new naming patterns
+        if category in TIMELINE_CATEGORIES:
+            data = parse_migration_timeline(filepath)
+
+            if data:
+                timelines[size_mb] = data
+
+    if not timelines:
+        print("No migration timeline data found")
+        return
+
+    # Sizes whose chart is newer than the results and this script are not redrawn
+    sizes = []
+    for size_mb in sorted(timelines):
+        if is_up_to_date(TIMELINE_PNG.format(size_mb), RESULTS_DIR, __file__):
+            print(f"✓ Up-to-date: {TIMELINE_PNG.format(size_mb)}")
+        else:
+            sizes.append(size_mb)
+
+    # Each size is an independent figure, so render them in parallel
+    with ProcessPoolExecutor() as executor:
+        for filename in executor.map(render_timeline, sizes, [timelines[s] for s in sizes]):
+            print(f"✓ Saved: {filename}")
 
 def plot_migration_cost():
     """Generate migration cost comparison visualization"""
-    sizes = []
-    baseline_times = {}
-    static_times = {}
-    migrated_times = {}
-
-    # Collect data
-    for filename in os.listdir(RESULTS_DIR):
-        baseline_match = re.match(r'baseline_local_(\d+)MB\.txt', filename)
-        static_match = re.match(r'static_remote_(\d+)MB\.txt', filename)
-        migrated_match = re.match(r'auto_migrated_(\d+)MB\.txt', filename)
-
-        if baseline_match:
-            size_mb = int(baseline_match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            result = parse_sequential_test(filepath)
-            if result and 'time' in result:
-                if size_mb not in sizes:
-                    sizes.append(size_mb)
-                baseline_times[size_mb] = result['time']
-
-        elif static_match:
-            size_mb = int(static_match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            result = parse_sequential_test(filepath)
-            if result and 'time' in result:
-                static_times[size_mb] = result['time']
-
-        elif migrated_match:
-            size_mb = int(migrated_match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            result = parse_migration_test(filepath)
-            if result and 'time' in result:
-                migrated_times[size_mb] = result['time']
-
-    if not sizes:
+    import matplotlib.pyplot as plt  # Deferred: the parsers are usable without loading pyplot
+
+    # Group the result files by size first, so only sizes with all three runs get parsed
+    paths_by_size = {}
+    for category, size_mb, filepath in scan_results():
+        if category in COST_KEYS:
+            paths_by_size.setdefault(size_mb, {})[category] = filepath
+
+    if not paths_by_size:
         print("No migration cost data found")
         return
 
-    sizes.sort()
-
-    # Filter sizes that have all three measurements
-    valid_sizes = [s for s in sizes if s in baseline_times and s in static_times and s in migrated_times]
+    valid_sizes = []
+    baseline = []
+    static = []
+    migrated = []
+
+    for size_mb in sorted(paths_by_size):
+        paths = paths_by_size[size_mb]
+        if paths.keys() != COST_KEYS.keys():
+            continue
+
+        results = (parse_sequential_test(paths['baseline_local']),
+                   parse_sequential_test(paths['static_remote']),
+                   parse_migration_test(paths['auto_migrated']))
+        # Keep only sizes that have all three measurements
+        if all(result and 'time' in result for result in results):
+            valid_sizes.append(size_mb)
+            baseline.append(results[0]['time'])
+            static.append(results[1]['time'])
+            migrated.append(results[2]['time'])
 
     if not valid_sizes:
         print("No complete data sets found")
         return
 
+    if is_up_to_date('category4_migration_cost.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category4_migration_cost.png")
+        return
+
     # Prepare data
-    size_labels = [f"{s // 1024} GB" if s >= 1024 else f"{s} MB" for s in valid_sizes]
-    baseline = [baseline_times[s] for s in valid_sizes]
-    static = [static_times[s] for s in valid_sizes]
-    migrated = [migrated_times[s] for s in valid_sizes]
+    size_labels = [format_size_label(s) for s in valid_sizes]
 
     # Create bar chart
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    x = np.arange(len(valid_sizes))
-    width = 0.25
-
-    bars1 = ax.bar(x - width, baseline, width, label='Baseline Local\n(Mem=Node0, CPU=Node0)',
-                   color='#2ca02c', alpha=0.8)
-    bars2 = ax.bar(x, static, width, label='Static Remote\n(Mem=Node1, CPU=Node0, No Migration)',
-                   color='#ff7f0e', alpha=0.8)
-    bars3 = ax.bar(x + width, migrated, width, label='Auto-Migrated\n(Start Remote → Migrate to Local)',
-                   color='#d62728', alpha=0.8)
-
-    # Add value labels on bars
-    def add_labels(bars):
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}s',
-                   ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    add_labels(bars1)
-    add_labels(bars2)
-    add_labels(bars3)
-
-    # Add overhead percentages
-    for i, size in enumerate(valid_sizes):
-        base = baseline[i]
-        mig = migrated[i]
-        overhead_pct = ((mig - base) / base) * 100 if base > 0 else 0
-
-        # Draw arrow from baseline to migrated
-        y_pos = max(base, mig) * 1.1
-        ax.annotate('', xy=(i + width, mig), xytext=(i - width, base),
-                   arrowprops=dict(arrowstyle='<->', color='purple', lw=2, alpha=0.6))
-        ax.text(i, y_pos, f'+{overhead_pct:.0f}%\noverhead',
-               ha='center', va='bottom', fontsize=10, color='purple', fontweight='bold',
-               bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
-                        edgecolor='purple', alpha=0.8))
-
-    # Formatting
-    ax.set_xlabel('Memory Size', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Execution Time (seconds)', fontsize=12, fontweight='bold')
-    ax.set_title('Test Category 4: Migration Cost Comparison\nBaseline vs Static Remote vs Auto-Migrated',
-                fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(size_labels, fontsize=11)
-    ax.legend(fontsize=10, loc='upper left')
-    ax.grid(True, alpha=0.3, axis='y')
-
-    # Add explanation box
-    explanation = ("Migration overhead includes:\n"
-                  "• Manual page movement to remote node\n"
-                  "• 50 iterations of full array access\n"
-                  "• Auto-NUMA scanning & migration\n"
-                  "• TLB shootdowns during migration")
-    ax.text(0.98, 0.97, explanation,
-           transform=ax.transAxes, fontsize=9,
-           verticalalignment='top', horizontalalignment='right',
-           bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
-
-    plt.tight_layout()
-    plt.savefig('category4_migration_cost.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category4_migration_cost.png")
-    plt.close()
+    fig, ax = plt.subplots(figsize=(14, 8), constrained_layout=True)
+    try:
+        x = np.arange(len(valid_sizes))
+        width = 0.25
+
+        bars1 = ax.bar(x - width, baseline, width, label='Baseline Local\n(Mem=Node0, CPU=Node0)',
+                       color='#2ca02c', alpha=0.8)
+        bars2 = ax.bar(x, static, width, label='Static Remote\n(Mem=Node1, CPU=Node0, No Migration)',
+                       color='#ff7f0e', alpha=0.8)
+        bars3 = ax.bar(x + width, migrated, width, label='Auto-Migrated\n(Start Remote → Migrate to Local)',
+                       color='#d62728', alpha=0.8)
+
+        # Add value labels on bars
+        for bars in (bars1, bars2, bars3):
+            ax.bar_label(bars, fmt='{:.1f}s', fontsize=9, fontweight='bold')
+
+        # Add overhead percentages
+        for i, size in enumerate(valid_sizes):
+            base = baseline[i]
+            mig = migrated[i]
+            overhead_pct = ((mig - base) / base) * 100 if base > 0 else 0
+
+            # Draw arrow from baseline to migrated
+            y_pos = max(base, mig) * 1.1
+            ax.annotate('', xy=(i + width, mig), xytext=(i - width, base),
+                       arrowprops=dict(arrowstyle='<->', color='purple', lw=2, alpha=0.6))
+            ax.text(i, y_pos, f'+{overhead_pct:.0f}%\noverhead',
+                   ha='center', va='bottom', fontsize=10, color='purple', fontweight='bold',
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                            edgecolor='purple', alpha=0.8))
+
+        # Headroom so the overhead boxes (drawn at 1.1x the taller bar) stay inside the axes
+        ax.set_ylim(top=max(baseline + static + migrated) * 1.3)
+
+        # Formatting
+        ax.set_xlabel('Memory Size', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Execution Time (seconds)', fontsize=12, fontweight='bold')
+        ax.set_title('Test Category 4: Migration Cost Comparison\nBaseline vs Static Remote vs Auto-Migrated',
+                    fontsize=14, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels(size_labels, fontsize=11)
+        ax.legend(fontsize=10, loc='upper left')
+        ax.grid(True, alpha=0.3, axis='y')
+
+        # Add explanation box
+        explanation = ("Migration overhead includes:\n"
+                      "• Manual page movement to remote node\n"
+                      "• 50 iterations of full array access\n"
+                      "• Auto-NUMA scanning & migration\n"
+                      "• TLB shootdowns during migration")
+        ax.text(0.98, 0.97, explanation,
+               transform=ax.transAxes, fontsize=9,
+               verticalalignment='top', horizontalalignment='right',
+               bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
+
+        fig.savefig('category4_migration_cost.png', dpi=300)
+        print("✓ Saved: category4_migration_cost.png")
+    finally:
+        plt.close(fig)
 
 if __name__ == '__main__':
     print("Generating Test Category 4 visualizations...\n")
@@ -4,73 +4,57 @@ Test Category 4 - Script 2: Migration Cost Analysis
 Compare performance: local vs static-remote vs auto-migrated
 """
 
-import os
-import re
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever saved to PNG
 import numpy as np
+from category4_common import RESULTS_DIR, collect_cost_data, format_size_label
+from plot_freshness import is_up_to_date
 
-RESULTS_DIR = "numa_results_advanced/Test4"
+def draw_migration_cost(data, sizes):
+    """Render the migration cost bar chart to category4_migration_cost.png"""
+    import matplotlib.pyplot as plt  # Deferred: the collectors are usable without loading pyplot
 
-def parse_throughput(filepath):
-    """Extract throughput from result file"""
+    fig, ax = plt.subplots(figsize=(12, 7), constrained_layout=True)
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        throughput_match = re.search(r'Throughput:\s+([\d.]+)\s+MB/s', content)
-        return float(throughput_match.group(1)) if throughput_match else None
-    except:
-        return None
-
-def collect_cost_data():
-    """Collect data for migration cost comparison"""
-    data = {}  # {size: {'baseline': X, 'static_remote': Y, 'auto_migrated': Z}}
-
-    for filename in sorted(os.listdir(RESULTS_DIR)):
-        # Parse baseline local files
-        match = re.match(r'baseline_local_(\d+)MB\.txt', filename)
-        if match:
-            size_mb = int(match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            throughput = parse_throughput(filepath)
-
-            if throughput is not None:
-                if size_mb not in data:
-                    data[size_mb] = {}
-                data[size_mb]['baseline'] = throughput
-
-        # Parse static remote files
-        match = re.match(r'static_remote_(\d+)MB\.txt', filename)
-        if match:
-            size_mb = int(match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            throughput = parse_throughput(filepath)
-
-            if throughput is not None:
-                if size_mb not in data:
-                    data[size_mb] = {}
-                data[size_mb]['static_remote'] = throughput
-
-        # Parse auto-migrated files
-        match = re.match(r'auto_migrated_(\d+)MB\.txt', filename)
-        if match:
-            size_mb = int(match.group(1))
-            filepath = os.path.join(RESULTS_DIR, filename)
-            throughput = parse_throughput(filepath)
-
-            if throughput is not None:
-                if size_mb not in data:
-                    data[size_mb] = {}
-                data[size_mb]['auto_migrated'] = throughput
-
-    return data
-
-def format_size_label(size_mb):
-    """Convert MB to GB if >= 1024 MB for clearer labels"""
-    if size_mb >= 1024:
-        return f'{size_mb // 1024} GB'
-    else:
-        return f'{size_mb} MB'
+        x = np.arange(len(sizes))
+        width = 0.25
+
+        baseline_perf = []
+        static_remote_perf = []
+        auto_migrated_perf = []
+
+        for size in sizes:
+            baseline_perf.append(data[size].get('baseline', 0))
+            static_remote_perf.append(data[size].get('static_remote', 0))
+            auto_migrated_perf.append(data[size].get('auto_migrated', 0))
+
+        # Plot bars
+        bars1 = ax.bar(x - width, baseline_perf, width, label='Baseline Local (Best Case)',
+                       color='#2ca02c', alpha=0.8)
+        bars2 = ax.bar(x, static_remote_perf, width, label='Static Remote (No Migration)',
+                       color='#d62728', alpha=0.8)
+        bars3 = ax.bar(x + width, auto_migrated_perf, width, label='Auto-Migrated (Kernel Optimization)',
+                       color='#1f77b4', alpha=0.8)
+
+        # Add value labels on bars (missing measurements are plotted as 0 and left unlabelled)
+        for bars, values in ((bars1, baseline_perf), (bars2, static_remote_perf),
+                             (bars3, auto_migrated_perf)):
+            ax.bar_label(bars, labels=[f'{v:.0f}' if v > 0 else '' for v in values],
+                         fontsize=8, fontweight='bold')
+
+        ax.set_xlabel('Memory Size', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Throughput (MB/s)', fontsize=12, fontweight='bold')
+        ax.set_title('Migration Cost Analysis: Is Migration Worth It?',
+                    fontsize=14, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels([format_size_label(s) for s in sizes])
+        ax.legend(fontsize=10, loc='upper right')
+        ax.grid(True, alpha=0.3, axis='y')
+
+        fig.savefig('category4_migration_cost.png', dpi=300)
+        print("✓ Saved: category4_migration_cost.png")
+    finally:
+        plt.close(fig)
 
 def plot_migration_cost():
     """Create migration cost comparison bar chart"""
@@ -81,53 +65,10 @@ def plot_migration_cost():
         print("No data found for migration cost analysis")
         return
 
-    fig, ax = plt.subplots(figsize=(12, 7))
-
-    x = np.arange(len(sizes))
-    width = 0.25
-
-    baseline_perf = []
-    static_remote_perf = []
-    auto_migrated_perf = []
-
-    for size in sizes:
-        baseline_perf.append(data[size].get('baseline', 0))
-        static_remote_perf.append(data[size].get('static_remote', 0))
-        auto_migrated_perf.append(data[size].get('auto_migrated', 0))
-
-    # Plot bars
-    ax.bar(x - width, baseline_perf, width, label='Baseline Local (Best Case)',
-           color='#2ca02c', alpha=0.8)
-    ax.bar(x, static_remote_perf, width, label='Static Remote (No Migration)',
-           color='#d62728', alpha=0.8)
-    ax.bar(x + width, auto_migrated_perf, width, label='Auto-Migrated (Kernel Optimization)',
-           color='#1f77b4', alpha=0.8)
-
-    # Add value labels on bars
-    for i in range(len(sizes)):
-        if baseline_perf[i] > 0:
-            ax.text(i - width, baseline_perf[i], f'{baseline_perf[i]:.0f}',
-                   ha='center', va='bottom', fontsize=8, fontweight='bold')
-        if static_remote_perf[i] > 0:
-            ax.text(i, static_remote_perf[i], f'{static_remote_perf[i]:.0f}',
-                   ha='center', va='bottom', fontsize=8, fontweight='bold')
-        if auto_migrated_perf[i] > 0:
-            ax.text(i + width, auto_migrated_perf[i], f'{auto_migrated_perf[i]:.0f}',
-                   ha='center', va='bottom', fontsize=8, fontweight='bold')
-
-    ax.set_xlabel('Memory Size', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Throughput (MB/s)', fontsize=12, fontweight='bold')
-    ax.set_title('Migration Cost Analysis: Is Migration Worth It?',
-                fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels([format_size_label(s) for s in sizes])
-    ax.legend(fontsize=10, loc='upper right')
-    ax.grid(True, alpha=0.3, axis='y')
-
-    plt.tight_layout()
-    plt.savefig('category4_migration_cost.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category4_migration_cost.png")
-    plt.show()
+    if is_up_to_date('category4_migration_cost.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category4_migration_cost.png")
+    else:
+        draw_migration_cost(data, sizes)
 
     # Print analysis
     print("\n=== Migration Cost Analysis ===")
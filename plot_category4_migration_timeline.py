@@ -4,157 +4,270 @@ Test Category 4 - Script 1: Migration Timeline
 Shows page distribution changing over time (Initial → Mid → Final)
 """
 
+import functools
+import io
 import os
+import pickle
 import re
-import matplotlib.pyplot as plt
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+
+# Headless by default; set NUMA_PLOT_INTERACTIVE=1 to also open the figure in a window
+INTERACTIVE = bool(os.environ.get('NUMA_PLOT_INTERACTIVE'))
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
+# Draft resolution by default; set NUMA_PLOT_DPI=300 for publication-quality output
+SAVE_DPI = int(os.environ.get('NUMA_PLOT_DPI', '150'))
+
+import numpy as np  # Module-level: the parser builds the timeline arrays
+from plot_freshness import is_up_to_date
 
 RESULTS_DIR = "numa_results_advanced/Test4"
 
+# Parsed timelines from earlier runs, {path: (mtime_ns, timeline)}; unchanged files skip parsing.
+# Bump the version whenever the parsed timeline layout changes so stale caches are ignored
+TIMELINE_CACHE = os.path.join(RESULTS_DIR, '.timeline_cache.pkl')
+TIMELINE_CACHE_VERSION = 3
+
+# Page distribution snapshots printed by the migration test; lines are sliced
+# directly and the regex is only the fallback for unusual layouts
+DISTRIBUTION_RE = re.compile(r'(Initial|Mid-execution|Final) distribution: Node0=(\d+)%, Node1=(\d+)%')
+# Phase name -> column of the parsed timeline array
+PHASE_COLUMNS = {'Initial': 0, 'Mid-execution': 1, 'Final': 2}
+
+# (legend label, colour) per NUMA node, in timeline row order
+NODE_STYLES = (('Node 0', '#2ca02c'), ('Node 1', '#ff7f0e'))
+
+# Result file names, anchored so .perf/.vmstat_* sidecars are rejected outright
+AUTO_NUMA_FILE_RE = re.compile(r'auto_numa_(\d+)MB_(sequential|random|stride)\.txt$')
+PRESSURE_FILE_RE = re.compile(r'pressure_migration_(\d+)MB_(sequential|random|stride)\.txt$')
+
+# (filename prefix, filename regex, key in collect_timeline_data) per migration test type
+TIMELINE_FILE_TYPES = (
+    ('auto_numa_', AUTO_NUMA_FILE_RE, 'auto_numa'),
+    ('pressure_migration_', PRESSURE_FILE_RE, 'pressure'),
+)
+
+def parse_distribution(line):
+    """(node0, node1) from '... Node0=NN%, Node1=NN%' by slicing; ValueError if absent"""
+    node0_start = line.index('Node0=') + 6
+    node0_end = line.index('%', node0_start)
+    node1_start = line.index('Node1=', node0_end) + 6
+    node1_end = line.index('%', node1_start)
+    return int(line[node0_start:node0_end]), int(line[node1_start:node1_end])
+
 def parse_migration_data(filepath):
-    """Extract page distribution timeline from migration test output"""
+    """Extract page distribution timeline from migration test output
+
+    Returns a 2x3 integer array: rows are Node0/Node1 percentages, columns are
+    the initial, mid-execution and final snapshots. Distribution lines whose
+    percentages do not parse are skipped; None if the file cannot be read or
+    any snapshot is missing.
+    """
+    timeline = np.zeros((2, len(PHASE_COLUMNS)), dtype=int)
+    seen = set()
+
     try:
         with open(filepath, 'r') as f:
-            content = f.read()
-
-        # Extract distributions
-        initial_match = re.search(r'Initial distribution: Node0=(\d+)%, Node1=(\d+)%', content)
-        mid_match = re.search(r'Mid-execution distribution: Node0=(\d+)%, Node1=(\d+)%', content)
-        final_match = re.search(r'Final distribution: Node0=(\d+)%, Node1=(\d+)%', content)
-
-        if initial_match and mid_match and final_match:
-            return {
-                'initial': {'node0': int(initial_match.group(1)), 'node1': int(initial_match.group(2))},
-                'mid': {'node0': int(mid_match.group(1)), 'node1': int(mid_match.group(2))},
-                'final': {'node0': int(final_match.group(1)), 'node1': int(final_match.group(2))}
-            }
-    except:
+            # Stream the lines and stop as soon as every phase has been seen;
+            # the first snapshot of each phase wins
+            for line in f:
+                # Parse: "Initial distribution: Node0=0%, Node1=100%"
+                phase, found, _ = line.partition(' distribution:')
+                if not found:
+                    continue
+                try:
+                    column = PHASE_COLUMNS[phase]
+                    node0, node1 = parse_distribution(line)
+                except (KeyError, ValueError):
+                    match = DISTRIBUTION_RE.search(line)
+                    if not match:
+                        continue
+                    column = PHASE_COLUMNS[match.group(1)]
+                    node0, node1 = int(match.group(2)), int(match.group(3))
+
+                if column not in seen:
+                    seen.add(column)
+                    timeline[:, column] = node0, node1
+                    if len(seen) == len(PHASE_COLUMNS):
+                        return timeline
+    except OSError:
         pass
 
     return None
 
-def collect_timeline_data():
-    """Collect timeline data for auto-NUMA and pressure-induced tests"""
-    data = {
-        'auto_numa': {},      # {size: {pattern: timeline_data}}
-        'pressure': {}         # {size: {pattern: timeline_data}}
+def load_timeline_cache():
+    """Read the on-disk parse cache; a missing or unreadable cache is just empty"""
+    try:
+        with open(TIMELINE_CACHE, 'rb') as f:
+            version, cache = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return {}
+    return cache if version == TIMELINE_CACHE_VERSION else {}
+
+def save_timeline_cache(cache):
+    """Write the parse cache back; a read-only results directory only costs the reuse"""
+    try:
+        with open(TIMELINE_CACHE, 'wb') as f:
+            pickle.dump((TIMELINE_CACHE_VERSION, cache), f, protocol=5)
+    except OSError:
+        pass
+
+def empty_timeline_data():
+    """Timeline data with no results for either test type"""
+    return {
+        'auto_numa': {},      # {(size, pattern): timeline_data}
+        'pressure': {}         # {(size, pattern): timeline_data}
     }
 
-    for filename in sorted(os.listdir(RESULTS_DIR)):
-        # Parse auto-NUMA files
-        match = re.match(r'auto_numa_(\d+)MB_(sequential|random|stride)\.txt', filename)
-        if match:
-            size_mb = int(match.group(1))
-            pattern = match.group(2)
+@functools.lru_cache(maxsize=4)
+def load_timeline_data(results_dir, dir_mtime_ns):
+    """Collect timeline data from results_dir, cached per directory mtime
 
-            filepath = os.path.join(RESULTS_DIR, filename)
-            timeline = parse_migration_data(filepath)
+    Adding or removing a result file bumps dir_mtime_ns and forces a rescan.
+    Cached, so treat the returned dict as read-only.
+    """
+    data = empty_timeline_data()
 
-            if timeline:
-                if size_mb not in data['auto_numa']:
-                    data['auto_numa'][size_mb] = {}
-                data['auto_numa'][size_mb][pattern] = timeline
+    # Only .txt results are considered; sorted so patterns keep a stable order per size
+    with os.scandir(results_dir) as it:
+        entries = [entry for entry in it if entry.name.endswith('.txt')]
+    entries.sort(key=lambda entry: entry.name)
+
+    matched = []  # (test_type, size_mb, pattern, path, mtime_ns), in filename order
+    for entry in entries:
+        # The prefix check picks the one regex worth running for this name
+        for prefix, file_re, test_type in TIMELINE_FILE_TYPES:
+            if entry.name.startswith(prefix):
+                break
+        else:
+            continue
 
-        # Parse pressure-induced files
-        match = re.match(r'pressure_migration_(\d+)MB_(sequential|random|stride)\.txt', filename)
+        match = file_re.match(entry.name)
         if match:
-            size_mb = int(match.group(1))
-            pattern = match.group(2)
+            matched.append((test_type, int(match.group(1)), match.group(2),
+                            entry.path, entry.stat().st_mtime_ns))
 
-            filepath = os.path.join(RESULTS_DIR, filename)
-            timeline = parse_migration_data(filepath)
+    # Files changed since the cached parse are read concurrently (the work is mostly I/O)
+    cache = load_timeline_cache()
+    stale = [path for _, _, _, path, mtime_ns in matched
+             if path not in cache or cache[path][0] != mtime_ns]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        parsed = dict(zip(stale, executor.map(parse_migration_data, stale)))
 
-            if timeline:
-                if size_mb not in data['pressure']:
-                    data['pressure'][size_mb] = {}
-                data['pressure'][size_mb][pattern] = timeline
+    # Results are inserted on this thread, in filename order
+    fresh_cache = {}  # Only files still present are carried over
+    for test_type, size_mb, pattern, path, mtime_ns in matched:
+        timeline = parsed[path] if path in parsed else cache[path][1]
+        fresh_cache[path] = (mtime_ns, timeline)
+
+        if timeline is not None:
+            data[test_type][(size_mb, pattern)] = timeline
+
+    # Timelines are arrays, so compare what changed rather than the dicts themselves
+    if stale or fresh_cache.keys() != cache.keys():
+        save_timeline_cache(fresh_cache)
 
     return data
 
-def plot_migration_timeline():
-    """Create migration timeline visualization"""
-    data = collect_timeline_data()
+def collect_timeline_data():
+    """Collect timeline data for auto-NUMA and pressure-induced tests"""
+    try:
+        dir_mtime_ns = os.stat(RESULTS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return empty_timeline_data()
+    return load_timeline_data(RESULTS_DIR, dir_mtime_ns)
+
+def draw_migration_timeline(data):
+    """Render the representative auto-NUMA and pressure timelines to category4_migration_timeline.png"""
+    import matplotlib.pyplot as plt  # Deferred: runs without data or with a fresh PNG never load pyplot
 
     # Create figure with subplots for auto-NUMA and pressure-induced
-    fig, axes = plt.subplots(2, 1, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 1, figsize=(14, 10), constrained_layout=True)
+    try:
+        test_types = [('auto_numa', 'Auto-NUMA Migration', axes[0]),
+                      ('pressure', 'Pressure-Induced Migration', axes[1])]
 
-    test_types = [('auto_numa', 'Auto-NUMA Migration', axes[0]),
-                  ('pressure', 'Pressure-Induced Migration', axes[1])]
+        for test_type, title, ax in test_types:
+            if not data[test_type]:
+                ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
+                       transform=ax.transAxes, fontsize=12)
+                ax.set_title(title, fontsize=14, fontweight='bold')
+                continue
 
-    for test_type, title, ax in test_types:
-        if not data[test_type]:
-            ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
-                   transform=ax.transAxes, fontsize=12)
-            ax.set_title(title, fontsize=14, fontweight='bold')
-            continue
+            # Use a representative size (e.g., 1024MB) and pattern (sequential)
+            representative_size = 1024
+            representative_pattern = 'sequential'
+
+            timeline = data[test_type].get((representative_size, representative_pattern))
+            if timeline is not None:
+                # Prepare data for stacked bar chart: one row per node
+                phases = ['Initial', 'Mid-Execution', 'Final']
+                bottoms = np.cumsum(timeline, axis=0) - timeline  # Each layer sits on the rows below it
+                node0_percentages = timeline[0]
+
+                x = np.arange(len(phases))
+                width = 0.6
+
+                # Create stacked bar chart, one layer per node, with percentage
+                # labels at the middle of each non-empty segment
+                label_style = dict(ha='center', va='center', fontweight='bold', fontsize=11, color='white')
+                for row, bottom, (label, color) in zip(timeline, bottoms, NODE_STYLES):
+                    ax.bar(x, row, width, bottom=bottom, label=label, color=color, alpha=0.8)
+                for row, bottom in zip(timeline, bottoms):
+                    for i in np.flatnonzero(row > 0):
+                        ax.text(i, bottom[i] + row[i] / 2, f'{row[i]}%', **label_style)
+
+                ax.set_xlabel('Execution Phase', fontsize=12, fontweight='bold')
+                ax.set_ylabel('Page Distribution (%)', fontsize=12, fontweight='bold')
+                ax.set_title(f'{title}\n({representative_size}MB, {representative_pattern} access)',
+                            fontsize=14, fontweight='bold')
+                ax.set_xticks(x)
+                ax.set_xticklabels(phases)
+                ax.set_ylim(0, 100)
+                ax.legend(fontsize=11, loc='upper right')
+                ax.grid(True, alpha=0.3, axis='y')
+
+                # Add migration arrow annotation
+                if node0_percentages[0] != node0_percentages[-1]:
+                    migration_amount = node0_percentages[-1] - node0_percentages[0]
+                    arrow_text = f'Migration:\n{abs(migration_amount)}% to Node {"0" if migration_amount > 0 else "1"}'
+                    ax.annotate(arrow_text, xy=(2, 50), xytext=(0.5, 50),
+                               arrowprops=dict(arrowstyle='->', color='red', lw=2),
+                               fontsize=10, fontweight='bold', color='red',
+                               bbox=dict(boxstyle='round,pad=0.5', facecolor='white', edgecolor='red'))
+
+        fig.savefig('category4_migration_timeline.png', dpi=SAVE_DPI, bbox_inches='tight')
+        print("✓ Saved: category4_migration_timeline.png")
+        if INTERACTIVE:
+            plt.show()
+    finally:
+        plt.close(fig)
+
+def plot_migration_timeline():
+    """Create migration timeline visualization"""
+    data = collect_timeline_data()
+    if not data['auto_numa'] and not data['pressure']:
+        print("No migration timeline data found")
+        return
+
+    # An interactive run always draws, since it is asked to open the figure
+    if not INTERACTIVE and is_up_to_date('category4_migration_timeline.png', RESULTS_DIR, __file__):
+        print("✓ Up-to-date: category4_migration_timeline.png")
+    else:
+        draw_migration_timeline(data)
 
-        # Use a representative size (e.g., 1024MB) and pattern (sequential)
-        representative_size = 1024
-        representative_pattern = 'sequential'
-
-        if representative_size in data[test_type] and representative_pattern in data[test_type][representative_size]:
-            timeline = data[test_type][representative_size][representative_pattern]
-
-            # Prepare data for stacked area chart
-            phases = ['Initial', 'Mid-Execution', 'Final']
-            node0_percentages = [timeline['initial']['node0'],
-                                timeline['mid']['node0'],
-                                timeline['final']['node0']]
-            node1_percentages = [timeline['initial']['node1'],
-                                timeline['mid']['node1'],
-                                timeline['final']['node1']]
-
-            x = np.arange(len(phases))
-            width = 0.6
-
-            # Create stacked bar chart
-            ax.bar(x, node0_percentages, width, label='Node 0', color='#2ca02c', alpha=0.8)
-            ax.bar(x, node1_percentages, width, bottom=node0_percentages,
-                  label='Node 1', color='#ff7f0e', alpha=0.8)
-
-            # Add percentage labels on bars
-            for i, (n0, n1) in enumerate(zip(node0_percentages, node1_percentages)):
-                if n0 > 0:
-                    ax.text(i, n0/2, f'{n0}%', ha='center', va='center',
-                           fontweight='bold', fontsize=11, color='white')
-                if n1 > 0:
-                    ax.text(i, n0 + n1/2, f'{n1}%', ha='center', va='center',
-                           fontweight='bold', fontsize=11, color='white')
-
-            ax.set_xlabel('Execution Phase', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Page Distribution (%)', fontsize=12, fontweight='bold')
-            ax.set_title(f'{title}\n({representative_size}MB, {representative_pattern} access)',
-                        fontsize=14, fontweight='bold')
-            ax.set_xticks(x)
-            ax.set_xticklabels(phases)
-            ax.set_ylim(0, 100)
-            ax.legend(fontsize=11, loc='upper right')
-            ax.grid(True, alpha=0.3, axis='y')
-
-            # Add migration arrow annotation
-            if node0_percentages[0] != node0_percentages[-1]:
-                migration_amount = node0_percentages[-1] - node0_percentages[0]
-                arrow_text = f'Migration:\n{abs(migration_amount)}% to Node {"0" if migration_amount > 0 else "1"}'
-                ax.annotate(arrow_text, xy=(2, 50), xytext=(0.5, 50),
-                           arrowprops=dict(arrowstyle='->', color='red', lw=2),
-                           fontsize=10, fontweight='bold', color='red',
-                           bbox=dict(boxstyle='round,pad=0.5', facecolor='white', edgecolor='red'))
-
-    plt.tight_layout()
-    plt.savefig('category4_migration_timeline.png', dpi=300, bbox_inches='tight')
-    print("✓ Saved: category4_migration_timeline.png")
-    plt.show()
-
-    # Print summary
-    print("\n=== Migration Timeline Summary ===")
+    # Print summary, built up first so it reaches stdout in a single write
+    summary = io.StringIO()
+    summary.write("\n=== Migration Timeline Summary ===\n")
     for test_type in ['auto_numa', 'pressure']:
         if data[test_type]:
-            print(f"\n{test_type.upper().replace('_', ' ')}:")
-            for size in sorted(data[test_type].keys()):
-                for pattern in data[test_type][size]:
-                    timeline = data[test_type][size][pattern]
-                    print(f"  {size}MB {pattern}: Node0 {timeline['initial']['node0']}% → "
-                          f"{timeline['mid']['node0']}% → {timeline['final']['node0']}%")
+            summary.write(f"\n{test_type.upper().replace('_', ' ')}:\n")
+            for (size, pattern), timeline in sorted(data[test_type].items()):
+                initial, mid, final = timeline[0].tolist()  # Plain ints format faster than NumPy scalars
+                summary.write(f"  {size}MB {pattern}: Node0 {initial}% → {mid}% → {final}%\n")
+    print(summary.getvalue(), end='')
 
 if __name__ == '__main__':
     plot_migration_timeline()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Shared Output Freshness Check
+Make-style test of whether a chart is newer than the results and the script it
+was drawn from, so a script can skip redrawing charts whose inputs have not changed
+"""
+
+import functools
+import os
+
+@functools.lru_cache(maxsize=8)
+def latest_input_mtime(results_dir):
+    """Newest modification time of results_dir and its entries
+
+    The directory's own mtime changes when a result is removed, so deletions
+    count as changes too. Hidden entries are skipped, so a cache a script keeps
+    next to the results (.timeline_cache.pkl) does not mark every chart stale.
+    Cached, so the value is only valid for one run.
+    """
+    with os.scandir(results_dir) as it:
+        newest = max((entry.stat().st_mtime for entry in it
+                      if not entry.name.startswith('.')), default=0)
+    return max(newest, os.stat(results_dir).st_mtime)
+
+def is_up_to_date(output, results_dir, script):
+    """True if output exists and is newer than every file in results_dir and than script
+
+    script is the calling plot script (its __file__), so editing the drawing
+    code re-renders the chart.
+    """
+    try:
+        return os.path.getmtime(output) > max(latest_input_mtime(results_dir),
+                                               os.path.getmtime(script))
+    except OSError:
+        return False